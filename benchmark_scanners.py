@@ -0,0 +1,571 @@
+# Copyright (c) 2026 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-18T00:00:00
+# Last Updated: 2026-10-18T00:00:00
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Benchmark suite for the bundled analysis scripts.
+
+Generates a deterministic synthetic corpus (JS/TS, Python, Go, SQL,
+Solidity, React/Vue and CJK text) with configurable size and match
+density, runs every scanner over it in a separate process and reports
+files/s, MB/s, peak RSS and the most expensive rules. Results can be saved
+as a baseline and later runs compared against it to catch regressions.
+
+Usage:
+    python benchmark_scanners.py [--scale <scale>] [--density <d>] [--seed <n>]
+                                 [--repeat <n>] [--only <name>]...
+                                 [--save-baseline <file>] [--compare <file>]
+
+Examples:
+    python benchmark_scanners.py
+    python benchmark_scanners.py --scale large --save-baseline bench-baseline.json
+    python benchmark_scanners.py --compare bench-baseline.json --threshold 0.2
+"""
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import random
+import re
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+
+ROOT = Path(__file__).resolve().parent
+
+SCALES = {
+    "small": 50,
+    "medium": 400,
+    "large": 3000,
+}
+
+
+def load_script(name: str, relative_path: str):
+    """Import a bundled script as a module."""
+    spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution so dataclasses and pickling resolve the module
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# Synthetic Corpus
+# ============================================================================
+
+# Per language: file extensions, benign lines and lines that trigger rules.
+# "{n}" is replaced with a running number so lines are not all identical.
+LANGUAGES = {
+    "js": {
+        "extensions": [".js", ".ts"],
+        "benign": [
+            "const value{n} = compute(input{n});",
+            "function handler{n}(req, res) {{",
+            "  return res.json({{ ok: true, id: {n} }});",
+            "}}",
+            "// explains step {n} of the pipeline",
+            "import {{ helper{n} }} from './module{n}';",
+            "export const LIMIT_{n} = {n};",
+        ],
+        "matching": [
+            "const result{n} = eval(userInput);",
+            "element.innerHTML = html{n};",
+            "const password = 'hunter{n}';",
+            "db.query(`SELECT * FROM t WHERE id = ${{id{n}}}`);",
+            "const digest{n} = md5(data);",
+            "res.redirect(req.query.next{n});",
+        ],
+    },
+    "py": {
+        "extensions": [".py"],
+        "benign": [
+            "def handler_{n}(request):",
+            "    value_{n} = compute(request.args)",
+            "    return {{'ok': True, 'id': {n}}}",
+            "# explains step {n} of the pipeline",
+            "import module_{n}",
+            "LIMIT_{n} = {n}",
+        ],
+        "matching": [
+            "result_{n} = eval(user_input)",
+            "os.system(command_{n})",
+            "api_key = 'secret-{n}'",
+            "cursor.execute(f\"SELECT * FROM t WHERE id = {{id_{n}}}\")",
+            "requests.get(url_{n}, verify=False)",
+            "data_{n} = pickle.loads(blob)",
+        ],
+    },
+    "go": {
+        "extensions": [".go"],
+        "benign": [
+            "func handler{n}(w http.ResponseWriter, r *http.Request) {{",
+            "\tvalue{n} := compute(r.URL.Query())",
+            "\treturn",
+            "}}",
+            "// explains step {n} of the pipeline",
+        ],
+        "matching": [
+            "\tq{n} := fmt.Sprintf(\"SELECT * FROM t WHERE id = %d\", id)",
+            "\tcfg{n} := &tls.Config{{InsecureSkipVerify: true}}",
+            "\th{n} := md5.New()",
+            "\tpassword := \"hunter{n}\"",
+        ],
+    },
+    "sql": {
+        "extensions": [".sql"],
+        "benign": [
+            "INSERT INTO events_{n} (id, name) VALUES ({n}, 'event');",
+            "CREATE INDEX CONCURRENTLY ix_events_{n} ON events_{n}(name);",
+            "SELECT id, name FROM events_{n} WHERE id = {n};",
+            "-- migration step {n}",
+        ],
+        "matching": [
+            "SELECT * FROM users_{n} u WHERE u.id = {n};",
+            "CREATE TABLE t_{n} (id INT PRIMARY KEY, price FLOAT, name VARCHAR(255));",
+            "DELETE FROM sessions_{n};",
+            "SELECT id FROM logs_{n} LIMIT 20 OFFSET 100000;",
+            "ALTER TABLE t_{n} ADD COLUMN c_{n} TEXT NOT NULL;",
+            "SELECT name FROM t_{n} WHERE LOWER(name) LIKE '%x%';",
+        ],
+    },
+    "sol": {
+        "extensions": [".sol"],
+        "header": [
+            "// SPDX-License-Identifier: MIT",
+            "pragma solidity 0.8.20;",
+            "",
+            "contract Synthetic {{",
+            "    mapping(address => uint256) balances;",
+        ],
+        "footer": ["}}"],
+        "benign": [
+            "    function get{n}(address a) external view returns (uint256) {{ return balances[a]; }}",
+            "    // explains step {n} of the pipeline",
+            "    event Updated{n}(address indexed who, uint256 amount);",
+        ],
+        "matching": [
+            "    function withdraw{n}(uint256 x) external {{ (bool ok, ) = msg.sender.call{{value: x}}(\"\"); require(ok); balances[msg.sender] -= x; }}",
+            "    function auth{n}() external view {{ require(tx.origin == address(0x1234567890123456789012345678901234567890)); }}",
+            "    function pay{n}(address[] calldata to) external {{ for (uint256 i; i < to.length; i++) {{ payable(to[i]).transfer(1); }} }}",
+            "    function late{n}() external view returns (bool) {{ return block.timestamp > {n}; }}",
+        ],
+    },
+    "frontend": {
+        "extensions": [".tsx", ".jsx", ".vue"],
+        "benign": [
+            "export const Item{n} = ({{ label }}) => <span>{{label}}</span>;",
+            "const styles{n} = useMemo(() => computeStyles({n}), []);",
+            "// explains step {n} of the component",
+            "import {{ Button{n} }} from './Button{n}';",
+        ],
+        "matching": [
+            "<div style={{{{ color: 'red', margin: {n} }}}}>",
+            "<button onClick={{() => {{ submit({n}); }}}}>Go</button>",
+            "console.log('render {n}');",
+            "<img src=\"/hero{n}.png\">",
+            "import * as _ from 'lodash';",
+            "<li v-for=\"item in items{n}\" v-if=\"item.visible\">",
+        ],
+    },
+    "text": {
+        "extensions": [".md", ".txt"],
+        "benign": [
+            "Paragraph {n} describes the deployment pipeline in detail.",
+            "- item {n}: configure the scanner thresholds",
+            "",
+        ],
+        "matching": [
+            "注释 {n}: 这是一个测试",
+            "Mixed line {n} with 中文 inside",
+        ],
+    },
+}
+
+
+# Marks a directory as a generated corpus that may be deleted and regenerated
+CORPUS_MARKER = ".scanner-bench-corpus"
+
+
+def generate_corpus(root: Path, files_per_language: int, density: float, seed: int) -> dict:
+    """Write a deterministic corpus under root and return its manifest.
+
+    File sizes follow a long-tailed distribution (most files small, a few
+    large); density is the fraction of lines that trigger a rule.
+    """
+    rng = random.Random(seed)
+    manifest = {"languages": {}}
+    root.mkdir(parents=True, exist_ok=True)
+    (root / CORPUS_MARKER).write_text("Generated by benchmark_scanners.py\n", encoding="utf-8")
+
+    for language, spec in LANGUAGES.items():
+        files = 0
+        total_bytes = 0
+        for index in range(files_per_language):
+            line_count = min(int(rng.lognormvariate(4.5, 1.0)) + 5, 20000)
+            lines = [line.format(n=index) for line in spec.get("header", [])]
+            for n in range(line_count):
+                pool = spec["matching"] if rng.random() < density else spec["benign"]
+                lines.append(rng.choice(pool).format(n=n))
+            lines.extend(line.format(n=index) for line in spec.get("footer", []))
+
+            extension = spec["extensions"][index % len(spec["extensions"])]
+            path = root / language / f"dir{index % 10:02d}" / f"file{index:05d}{extension}"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            data = "\n".join(lines) + "\n"
+            path.write_text(data, encoding="utf-8")
+
+            files += 1
+            total_bytes += len(data.encode("utf-8"))
+
+        manifest["languages"][language] = {"files": files, "bytes": total_bytes}
+
+    return manifest
+
+
+# ============================================================================
+# Benchmarks
+# ============================================================================
+
+def _run_security(corpus: Path) -> int:
+    module = load_script("security_audit", "skills/backend/scripts/security_audit.py")
+    scanner = module.SecurityScanner(min_severity=module.Severity.INFO)
+    findings = []
+    for language in ("js", "py", "go"):
+        findings.extend(scanner.scan_directory(corpus / language))
+    return len(findings)
+
+
+def _run_sql(corpus: Path) -> int:
+    module = load_script("sql_analyzer", "skills/backend/scripts/sql_analyzer.py")
+    return len(module.SQLAnalyzer().analyze_directory(corpus / "sql"))
+
+
+def _run_sql_streaming(corpus: Path) -> int:
+    module = load_script("sql_analyzer", "skills/backend/scripts/sql_analyzer.py")
+    return len(module.SQLAnalyzer().analyze_directory(corpus / "sql", streaming=True))
+
+
+def _run_performance(corpus: Path) -> int:
+    module = load_script("performance_audit", "skills/frontend/scripts/performance_audit.py")
+    return len(module.PerformanceAuditor().audit_directory(corpus / "frontend"))
+
+
+def _run_solidity(corpus: Path) -> int:
+    module = load_script("security_scan", "skills/smart-contract/scripts/security_scan.py")
+    files = sorted((corpus / "sol").rglob("*.sol"))
+    return sum(len(findings) for _, findings in module.scan_files(files))
+
+
+def _run_chinese(corpus: Path) -> int:
+    module = load_script("find_chinese_chars", "find_chinese_chars.py")
+    results = module.scan_directory(corpus / "text")
+    return sum(len(matches) for matches in results.values())
+
+
+# name -> (runner, corpus languages it reads)
+BENCHMARKS: Dict[str, Tuple[Callable[[Path], int], Tuple[str, ...]]] = {
+    "security_audit": (_run_security, ("js", "py", "go")),
+    "sql_analyzer": (_run_sql, ("sql",)),
+    "sql_analyzer_stream": (_run_sql_streaming, ("sql",)),
+    "performance_audit": (_run_performance, ("frontend",)),
+    "security_scan_sol": (_run_solidity, ("sol",)),
+    "find_chinese_chars": (_run_chinese, ("text",)),
+}
+
+
+def _bench_child(name: str, corpus: str, repeat: int, conn) -> None:
+    """Run one benchmark in a fresh process and send back its measurements."""
+    runner, _ = BENCHMARKS[name]
+    best = None
+    matches = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matches = runner(Path(corpus))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    conn.send({"seconds": best, "matches": matches, "peak_rss_mb": peak_mb})
+    conn.close()
+
+
+def run_benchmark(name: str, corpus: Path, manifest: dict, repeat: int) -> dict:
+    """Run a benchmark in a spawned process so peak RSS is its own."""
+    context = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_bench_child, args=(name, str(corpus), repeat, child_conn)
+    )
+    process.start()
+    child_conn.close()
+    result = parent_conn.recv()
+    process.join()
+
+    _, languages = BENCHMARKS[name]
+    files = sum(manifest["languages"][lang]["files"] for lang in languages)
+    size = sum(manifest["languages"][lang]["bytes"] for lang in languages)
+    seconds = max(result["seconds"], 1e-9)
+
+    return {
+        "files": files,
+        "megabytes": round(size / (1024 * 1024), 3),
+        "seconds": round(seconds, 4),
+        "files_per_s": round(files / seconds, 1),
+        "mb_per_s": round(size / (1024 * 1024) / seconds, 3),
+        "peak_rss_mb": round(result["peak_rss_mb"], 1),
+        "matches": result["matches"],
+    }
+
+
+# ============================================================================
+# Per-Rule Cost
+# ============================================================================
+
+def _read_lines(corpus: Path, language: str, suffixes=None) -> List[str]:
+    lines = []
+    for path in sorted((corpus / language).rglob("*")):
+        if path.is_file() and (suffixes is None or path.suffix in suffixes):
+            lines.extend(path.read_text(encoding="utf-8").split("\n"))
+    return lines
+
+
+def _time_rule(regex, lines: List[str]) -> Tuple[float, int]:
+    hits = 0
+    start = time.perf_counter()
+    for line in lines:
+        if regex.search(line):
+            hits += 1
+    return time.perf_counter() - start, hits
+
+
+def rule_costs(corpus: Path) -> List[dict]:
+    """Time every rule of the regex rule tables over the matching corpus lines."""
+    costs = []
+
+    security = load_script("security_audit", "skills/backend/scripts/security_audit.py")
+    group_lines = {group: _read_lines(corpus, group) for group in ("js", "py", "go")}
+    for group, pattern_defs in security.PATTERNS.items():
+        for p in pattern_defs:
+            regex = re.compile(p["pattern"], re.IGNORECASE)
+            seconds, hits = _time_rule(regex, group_lines[group])
+            costs.append({
+                "table": f"security_audit.PATTERNS[{group}]",
+                "rule": p["title"],
+                "seconds": seconds,
+                "lines": len(group_lines[group]),
+                "hits": hits,
+            })
+
+    sql = load_script("sql_analyzer", "skills/backend/scripts/sql_analyzer.py")
+    contents = [
+        path.read_text(encoding="utf-8")
+        for path in sorted((corpus / "sql").rglob("*.sql"))
+    ]
+    for p in sql.SQL_PATTERNS:
+        regex = re.compile(p["pattern"], re.IGNORECASE | re.MULTILINE)
+        hits = 0
+        start = time.perf_counter()
+        for content in contents:
+            hits += sum(1 for _ in regex.finditer(content))
+        costs.append({
+            "table": "sql_analyzer.SQL_PATTERNS",
+            "rule": p["title"],
+            "seconds": time.perf_counter() - start,
+            "lines": sum(c.count("\n") for c in contents),
+            "hits": hits,
+        })
+
+    performance = load_script("performance_audit", "skills/frontend/scripts/performance_audit.py")
+    frontend_lines = _read_lines(corpus, "frontend")
+    auditor = performance.PerformanceAuditor
+    for table in ("REACT_PATTERNS", "VUE_PATTERNS", "GENERAL_PATTERNS", "IMAGE_PATTERNS"):
+        for pattern, _, message, _ in getattr(auditor, table):
+            seconds, hits = _time_rule(re.compile(pattern, re.IGNORECASE), frontend_lines)
+            costs.append({
+                "table": f"PerformanceAuditor.{table}",
+                "rule": message,
+                "seconds": seconds,
+                "lines": len(frontend_lines),
+                "hits": hits,
+            })
+
+    costs.sort(key=lambda c: c["seconds"], reverse=True)
+    return costs
+
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Return a description of every metric that regressed beyond threshold."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if current["files_per_s"] < previous["files_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {current['files_per_s']} files/s "
+                f"< baseline {previous['files_per_s']} files/s"
+            )
+        if current["peak_rss_mb"] > previous["peak_rss_mb"] * (1 + threshold):
+            regressions.append(
+                f"{name}: peak RSS {current['peak_rss_mb']} MB "
+                f"> baseline {previous['peak_rss_mb']} MB"
+            )
+    return regressions
+
+
+# ============================================================================
+# Reporters
+# ============================================================================
+
+def report_text(results: Dict[str, dict], costs: List[dict], top: int) -> str:
+    """Generate text report."""
+    lines = [
+        "=" * 78,
+        "SCANNER BENCHMARKS",
+        "=" * 78,
+        f"{'benchmark':<22}{'files':>7}{'MB':>9}{'sec':>9}{'files/s':>10}{'MB/s':>9}{'RSS MB':>9}",
+        "-" * 78,
+    ]
+    for name, r in results.items():
+        lines.append(
+            f"{name:<22}{r['files']:>7}{r['megabytes']:>9.2f}{r['seconds']:>9.3f}"
+            f"{r['files_per_s']:>10.1f}{r['mb_per_s']:>9.2f}{r['peak_rss_mb']:>9.1f}"
+        )
+
+    if costs:
+        lines.append("")
+        lines.append(f"TOP {top} RULES BY TIME:")
+        lines.append("-" * 78)
+        for c in costs[:top]:
+            us_per_line = c["seconds"] / max(c["lines"], 1) * 1e6
+            lines.append(
+                f"{c['seconds'] * 1000:9.1f} ms {us_per_line:7.2f} us/line "
+                f"{c['hits']:>7} hits  {c['table']}: {c['rule']}"
+            )
+
+    lines.append("=" * 78)
+    return "\n".join(lines)
+
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the bundled analysis scripts on a synthetic corpus"
+    )
+    parser.add_argument(
+        "--scale",
+        choices=sorted(SCALES),
+        default="small",
+        help="Files per language: " + ", ".join(f"{k}={v}" for k, v in SCALES.items()),
+    )
+    parser.add_argument(
+        "--density",
+        type=float,
+        default=0.05,
+        help="Fraction of lines that trigger a rule (default: 0.05)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Corpus seed (default: 1)")
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per benchmark, the fastest is reported (default: 3)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        help="Run only the named benchmark (repeatable)",
+    )
+    parser.add_argument("--corpus", type=Path, help="Directory for the corpus (default: temporary)")
+    parser.add_argument("--top", type=int, default=10, help="Hot rules to list (default: 10)")
+    parser.add_argument("--no-rules", action="store_true", help="Skip per-rule timing")
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--save-baseline", type=Path, help="Write results to a baseline file")
+    parser.add_argument("--compare", type=Path, help="Compare against a baseline file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative regression when comparing (default: 0.15)",
+    )
+
+    args = parser.parse_args()
+
+    if args.corpus is not None and args.corpus.exists():
+        # Only a corpus this tool generated is ever deleted
+        if not args.corpus.is_dir() or (
+            any(args.corpus.iterdir()) and not (args.corpus / CORPUS_MARKER).is_file()
+        ):
+            parser.error(f"--corpus {args.corpus} is not empty and is not a generated corpus")
+
+    corpus = args.corpus or Path(tempfile.mkdtemp(prefix="scanner-bench-"))
+    corpus_params = {
+        "files_per_language": SCALES[args.scale],
+        "density": args.density,
+        "seed": args.seed,
+    }
+
+    try:
+        if (corpus / CORPUS_MARKER).is_file():
+            shutil.rmtree(corpus)
+        manifest = generate_corpus(corpus, **corpus_params)
+
+        results = {
+            name: run_benchmark(name, corpus, manifest, args.repeat)
+            for name in (args.only or BENCHMARKS)
+        }
+        costs = [] if args.no_rules else rule_costs(corpus)
+    finally:
+        if args.corpus is None:
+            shutil.rmtree(corpus, ignore_errors=True)
+
+    if args.format == "json":
+        print(json.dumps({"corpus": corpus_params, "results": results, "rules": costs[:args.top]}, indent=2))
+    else:
+        print(report_text(results, costs, args.top))
+
+    if args.save_baseline:
+        args.save_baseline.write_text(
+            json.dumps({"corpus": corpus_params, "results": results}, indent=2) + "\n",
+            encoding="utf-8",
+        )
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("corpus") != corpus_params:
+            print("Warning: baseline was recorded with a different corpus", file=sys.stderr)
+        regressions = compare(results, baseline.get("results", {}), args.threshold)
+        if regressions:
+            print("\nREGRESSIONS:", file=sys.stderr)
+            for regression in regressions:
+                print(f"  {regression}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@
 Выводит файлы и конкретные строки с китайскими символами.
 """
 
+import mmap
 import os
 import re
 import sys
@@ -25,13 +26,66 @@ from typing import List, Tuple
 
 CHINESE_PATTERN = re.compile(r'[\u4e00-\u9fff]')
 
+# Те же символы U+4E00..U+9FFF в виде байтов UTF-8
+CHINESE_BYTES_PATTERN = re.compile(rb'\xe4[\xb8-\xbf][\x80-\xbf]|[\xe5-\xe9][\x80-\xbf]{2}')
+
+# Файлы меньше этого размера читаются целиком, крупные отображаются через mmap
+MMAP_MIN_SIZE = 64 * 1024
+
 SKIP_DIRS = {'.git', '.ruff_cache', '__pycache__', 'node_modules', '.venv', 'venv'}
 
 SKIP_EXTENSIONS = {'.pyc', '.pyo', '.so', '.dylib', '.exe', '.bin', '.jpg', '.png', '.gif', '.ico', '.pdf'}
 
 
 def find_chinese_in_file(file_path: Path) -> List[Tuple[int, str]]:
-    """Находит строки с китайскими символами в файле."""
+    """Находит строки с китайскими символами в файле.
+
+    Поиск идёт по сырым байтам UTF-8, декодируются только строки с
+    совпадениями. Файлы без китайских символов проходятся за один вызов
+    регулярного выражения.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return []
+            if size < MMAP_MIN_SIZE:
+                return _find_chinese_in_bytes(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _find_chinese_in_bytes(data)
+    except ValueError:
+        # mmap недоступен (например, специальный файл) — построчный разбор
+        return _find_chinese_by_lines(file_path)
+    except (IOError, OSError):
+        return []
+
+
+def _find_chinese_in_bytes(data) -> List[Tuple[int, str]]:
+    """Ищет китайские символы в байтах и возвращает номера и текст строк."""
+    matches = []
+    line_num = 1
+    counted_to = 0
+
+    match = CHINESE_BYTES_PATTERN.search(data)
+    while match:
+        line_start = data.rfind(b'\n', 0, match.start()) + 1
+        line_end = data.find(b'\n', match.end())
+        if line_end == -1:
+            line_end = len(data)
+
+        line_num += data[counted_to:line_start].count(b'\n')
+        counted_to = line_start
+
+        line = data[line_start:line_end].decode('utf-8', errors='ignore')
+        matches.append((line_num, line.rstrip()))
+
+        match = CHINESE_BYTES_PATTERN.search(data, line_end)
+
+    return matches
+
+
+def _find_chinese_by_lines(file_path: Path) -> List[Tuple[int, str]]:
+    """Построчный поиск через текстовое чтение файла."""
     matches = []
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -0,0 +1,503 @@
+# Copyright (c) 2026 Bivex
+#
+# Author: Bivex
+# Available for contact via email: support@b-b.top
+# For up-to-date contact information:
+# https://github.com/bivex
+#
+# Created: 2026-10-18T00:00:00
+# Last Updated: 2026-10-18T00:00:00
+#
+# Licensed under the MIT License.
+# Commercial licensing available upon request.
+"""
+Persistent scan daemon for the bundled analysis scripts.
+
+Keeps security_audit.py, sql_analyzer.py and performance_audit.py loaded
+with their compiled rule sets, plus an index of per-file results keyed by
+mtime and size, and answers scan requests over a Unix socket. Repeated
+scans only re-analyze files that changed since the previous request.
+
+Usage:
+    python scan_daemon.py serve [--socket <path>]
+    python scan_daemon.py scan <tool> <path>... [--severity <level>] [--format <format>] [--exit-code]
+    python scan_daemon.py stop
+
+Tools:
+    security     skills/backend/scripts/security_audit.py
+    sql          skills/backend/scripts/sql_analyzer.py
+    performance  skills/frontend/scripts/performance_audit.py
+
+Examples:
+    python scan_daemon.py serve &
+    python scan_daemon.py scan security ./src --format json
+    python scan_daemon.py scan sql ./migrations --exit-code
+"""
+
+import argparse
+import dataclasses
+import getpass
+import importlib.util
+import json
+import os
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+
+ROOT = Path(__file__).resolve().parent
+
+
+
+def default_socket() -> Path:
+    """Socket path inside a directory only the current user may enter.
+
+    $XDG_RUNTIME_DIR is private by definition; otherwise a 0700 directory
+    of our own is used under the shared temp dir (see ensure_private_dir).
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "ultra-scan.sock"
+    return Path(tempfile.gettempdir()) / f"ultra-scan-{getpass.getuser()}" / "scan.sock"
+
+
+DEFAULT_SOCKET = default_socket()
+
+
+def load_script(name: str, relative_path: str):
+    """Import a bundled script as a module."""
+    spec = importlib.util.spec_from_file_location(name, ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution so dataclasses and pickling resolve the module
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# ============================================================================
+# Tool Adapters
+# ============================================================================
+
+class Tool:
+    """Uniform interface over one analysis script."""
+
+    name = ""
+    script = ""
+    formats: Tuple[str, ...] = ("text",)
+
+    def __init__(self):
+        self.module = load_script(Path(self.script).stem, self.script)
+        # Engines (scanner/analyzer instances) per option set, kept warm
+        self.engines: Dict[str, object] = {}
+
+    def engine(self, options: dict):
+        key = self.engine_key(options)
+        if key not in self.engines:
+            self.engines[key] = self.create_engine(options)
+        return self.engines[key]
+
+    def engine_key(self, options: dict) -> str:
+        return ""
+
+    def create_engine(self, options: dict):
+        raise NotImplementedError
+
+    def iter_files(self, engine, directory: Path):
+        return engine.iter_files(directory)
+
+    def scan_file(self, engine, file_path: Path) -> list:
+        raise NotImplementedError
+
+    def sort(self, engine, findings: list) -> None:
+        pass
+
+    def report(self, findings: list, fmt: str) -> str:
+        raise NotImplementedError
+
+    def exit_code(self, findings: list, options: dict) -> int:
+        return 0
+
+
+class SecurityAuditTool(Tool):
+    name = "security"
+    script = "skills/backend/scripts/security_audit.py"
+    formats = ("text", "json", "sarif")
+
+    def engine_key(self, options: dict) -> str:
+        return options.get("severity") or "low"
+
+    def create_engine(self, options: dict):
+        severity = self.module.Severity(self.engine_key(options))
+        return self.module.SecurityScanner(min_severity=severity)
+
+    def scan_file(self, engine, file_path: Path) -> list:
+        return engine.scan_file(file_path)
+
+    def sort(self, engine, findings: list) -> None:
+        findings.sort(key=lambda f: engine.severity_order.index(f.severity), reverse=True)
+
+    def report(self, findings: list, fmt: str) -> str:
+        if fmt == "json":
+            return self.module.report_json(findings)
+        if fmt == "sarif":
+            return self.module.report_sarif(findings)
+        return self.module.report_text(findings)
+
+    def exit_code(self, findings: list, options: dict) -> int:
+        if not (options.get("exit_code") and findings):
+            return 0
+        severity = self.module.Severity
+        critical_high = sum(
+            1 for f in findings
+            if f.severity in [severity.CRITICAL, severity.HIGH]
+        )
+        return min(critical_high, 125) or 1
+
+
+class SQLAnalyzerTool(Tool):
+    name = "sql"
+    script = "skills/backend/scripts/sql_analyzer.py"
+    formats = ("text", "json", "markdown")
+
+    def create_engine(self, options: dict):
+        return self.module.SQLAnalyzer()
+
+    def scan_file(self, engine, file_path: Path) -> list:
+        return engine.analyze_file(file_path)
+
+    def sort(self, engine, findings: list) -> None:
+        severity = self.module.Severity
+        order = [severity.HIGH, severity.MEDIUM, severity.LOW, severity.INFO]
+        findings.sort(key=lambda i: order.index(i.severity))
+
+    def report(self, findings: list, fmt: str) -> str:
+        if fmt == "json":
+            return self.module.report_json(findings)
+        if fmt == "markdown":
+            return self.module.report_markdown(findings)
+        return self.module.report_text(findings)
+
+    def exit_code(self, findings: list, options: dict) -> int:
+        if not (options.get("exit_code") and findings):
+            return 0
+        severity = self.module.Severity
+        high_medium = sum(
+            1 for i in findings
+            if i.severity in [severity.HIGH, severity.MEDIUM]
+        )
+        return min(high_medium, 125) or 1
+
+
+class PerformanceAuditTool(Tool):
+    name = "performance"
+    script = "skills/frontend/scripts/performance_audit.py"
+
+    def create_engine(self, options: dict):
+        return self.module.PerformanceAuditor()
+
+    def scan_file(self, engine, file_path: Path) -> list:
+        return engine.audit_file(file_path)
+
+    def report(self, findings: list, fmt: str) -> str:
+        return self.module.format_report(findings)
+
+    def exit_code(self, findings: list, options: dict) -> int:
+        high = self.module.Severity.HIGH
+        return 1 if any(i.severity == high for i in findings) else 0
+
+
+TOOLS = {
+    tool.name: tool
+    for tool in (SecurityAuditTool, SQLAnalyzerTool, PerformanceAuditTool)
+}
+
+
+# ============================================================================
+# Server
+# ============================================================================
+
+# Bounds on the file-state index: files kept per scanned root, and roots
+# kept overall (least recently scanned dropped first)
+MAX_INDEX_FILES_PER_ROOT = 100_000
+MAX_INDEX_ROOTS = 64
+
+FileIndex = Dict[str, Tuple[int, int, list]]
+
+
+class ScanService:
+    """Loaded tools plus the file-state index shared across requests."""
+
+    def __init__(self):
+        self.tools: Dict[str, Tool] = {}
+        # (tool, engine key, absolute root) -> {absolute path: (mtime_ns, size, findings)}
+        self.index: "OrderedDict[Tuple[str, str, str], FileIndex]" = OrderedDict()
+
+    def tool(self, name: str) -> Tool:
+        if name not in TOOLS:
+            raise ValueError(f"Unknown tool: {name}")
+        if name not in self.tools:
+            self.tools[name] = TOOLS[name]()
+        return self.tools[name]
+
+    def scan(self, request: dict) -> dict:
+        """Handle one scan request and return the rendered report."""
+        tool = self.tool(request["tool"])
+        options = request.get("options", {})
+        fmt = options.get("format") or "text"
+        if fmt not in tool.formats:
+            raise ValueError(f"Format {fmt!r} not supported by {tool.name}")
+
+        engine = tool.engine(options)
+        engine_key = tool.engine_key(options)
+
+        # Paths are reported relative to the client's working directory,
+        # exactly as the standalone script would print them
+        os.chdir(request.get("cwd") or "/")
+
+        findings = []
+        scanned = reused = 0
+        for raw in request["paths"]:
+            root_key = (tool.name, engine_key, os.path.abspath(raw))
+            previous = self.index.pop(root_key, {})
+            # Only files seen by this scan are kept, which drops deleted and
+            # renamed ones
+            current: FileIndex = {}
+
+            for file_path in self._expand(tool, engine, raw):
+                try:
+                    stat = file_path.stat()
+                except OSError:
+                    continue
+
+                key = os.path.abspath(file_path)
+                entry = previous.get(key)
+                if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    file_findings = [
+                        dataclasses.replace(f, file=str(file_path)) for f in entry[2]
+                    ]
+                    reused += 1
+                else:
+                    file_findings = tool.scan_file(engine, file_path)
+                    entry = (stat.st_mtime_ns, stat.st_size, file_findings)
+                    scanned += 1
+
+                if len(current) < MAX_INDEX_FILES_PER_ROOT:
+                    current[key] = entry
+                findings.extend(file_findings)
+
+            self.index[root_key] = current
+            while len(self.index) > MAX_INDEX_ROOTS:
+                self.index.popitem(last=False)
+
+        tool.sort(engine, findings)
+
+        return {
+            "output": tool.report(findings, fmt),
+            "exit_code": tool.exit_code(findings, options),
+            "scanned": scanned,
+            "reused": reused,
+        }
+
+    def _expand(self, tool: Tool, engine, raw: str) -> Iterator[Path]:
+        path = Path(raw)
+        if path.is_dir():
+            yield from tool.iter_files(engine, path)
+        elif path.is_file():
+            yield path
+
+
+class ScanRequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+
+        try:
+            request = json.loads(line)
+            if request.get("command") == "shutdown":
+                response = {"output": "Scan daemon stopped", "exit_code": 0}
+                # shutdown() blocks until serve_forever returns, so it must
+                # not run on the serving thread
+                threading.Thread(target=self.server.shutdown).start()
+            else:
+                response = self.server.service.scan(request)
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}", "exit_code": 2}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class ScanServer(socketserver.UnixStreamServer):
+    """Single-threaded server: requests are handled one at a time, so the
+    shared index and the working directory need no locking."""
+
+    def __init__(self, socket_path: Path):
+        self.service = ScanService()
+        super().__init__(str(socket_path), ScanRequestHandler)
+
+
+def ensure_private_dir(directory: Path) -> None:
+    """Create a 0700 directory, or check that an existing one is ours and private.
+
+    Another local user could otherwise pre-create it in the shared temp dir
+    and bind the socket first.
+    """
+    try:
+        directory.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} must be a directory owned by you with mode 0700")
+
+
+def serve(socket_path: Path) -> int:
+    """Run the daemon until a shutdown request arrives."""
+    if socket_path == DEFAULT_SOCKET:
+        try:
+            ensure_private_dir(socket_path.parent)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+
+    if socket_path.exists():
+        if _is_listening(socket_path):
+            print(f"Error: daemon already running on {socket_path}", file=sys.stderr)
+            return 1
+        socket_path.unlink()
+
+    # Created 0600 by bind itself, leaving no window before a chmod
+    old_umask = os.umask(0o177)
+    try:
+        server = ScanServer(socket_path)
+    finally:
+        os.umask(old_umask)
+
+    with server:
+        print(f"Scan daemon listening on {socket_path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        finally:
+            if socket_path.exists():
+                socket_path.unlink()
+    return 0
+
+
+# ============================================================================
+# Client
+# ============================================================================
+
+def _is_listening(socket_path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+def _check_peer(sock: socket.socket, socket_path: Path) -> None:
+    """Refuse a daemon run by another user, which could fake the results."""
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        _, uid, _ = struct.unpack("3i", creds)
+    else:
+        # No peer credentials (e.g. macOS): fall back to the socket's owner
+        uid = os.stat(socket_path).st_uid
+    if uid != os.getuid():
+        raise PermissionError(f"daemon on {socket_path} is run by uid {uid}, not by you")
+
+
+def send_request(socket_path: Path, request: dict) -> dict:
+    """Send one request to the daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        _check_peer(sock, socket_path)
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            return json.loads(stream.readline())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Persistent daemon for the bundled analysis scripts"
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_SOCKET,
+        help=f"Unix socket path (default: {DEFAULT_SOCKET})",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("serve", help="Run the daemon in the foreground")
+    commands.add_parser("stop", help="Stop a running daemon")
+
+    scan_parser = commands.add_parser("scan", help="Scan paths through the daemon")
+    scan_parser.add_argument("tool", choices=sorted(TOOLS))
+    scan_parser.add_argument("paths", nargs="+", help="Files or directories to scan")
+    scan_parser.add_argument(
+        "--severity",
+        choices=["critical", "high", "medium", "low", "info"],
+        help="Minimum severity to report (security only, default: low)",
+    )
+    scan_parser.add_argument(
+        "--format",
+        choices=["text", "json", "sarif", "markdown"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    scan_parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="Exit with non-zero code if issues found",
+    )
+
+    args = parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: Unix sockets are not available on this platform", file=sys.stderr)
+        sys.exit(1)
+
+    if args.command == "serve":
+        sys.exit(serve(args.socket))
+
+    if args.command == "stop":
+        request: dict = {"command": "shutdown"}
+    else:
+        request = {
+            "tool": args.tool,
+            "paths": args.paths,
+            "cwd": os.getcwd(),
+            "options": {
+                "severity": args.severity,
+                "format": args.format,
+                "exit_code": args.exit_code,
+            },
+        }
+
+    try:
+        response = send_request(args.socket, request)
+    except OSError as e:
+        print(f"Error: cannot reach scan daemon on {args.socket}: {e}", file=sys.stderr)
+        print("Start it with: python scan_daemon.py serve", file=sys.stderr)
+        sys.exit(2)
+
+    if "error" in response:
+        print(f"Error: {response['error']}", file=sys.stderr)
+    else:
+        print(response["output"])
+    sys.exit(response.get("exit_code", 0))
+
+
+if __name__ == "__main__":
+    main()
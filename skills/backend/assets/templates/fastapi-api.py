@@ -20,17 +20,38 @@ Production-ready FastAPI router with:
 - Error handling
 - Authentication/Authorization
 - Async database operations
+- Keyset (cursor) pagination
+- Cached token verification and user lookup
+- Bulk create/upsert/delete with per-item results
+- ETags, conditional GET and a response cache
+- Streaming NDJSON/CSV export
+- Opt-in fast JSON serialization for list pages
 """
 
+import base64
+import binascii
+import csv
+import hashlib
+import io
+import json
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Generic, TypeVar, Optional, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Generic, TypeVar, Optional, List, Protocol, Tuple
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
 from pydantic import BaseModel, Field
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+try:
+    import orjson
+except ImportError:  # Falls back to the stdlib encoder
+    orjson = None
+
 # ============================================================================
 # Schemas
 # ============================================================================
@@ -55,11 +76,15 @@ class ResourceUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = Field(None, max_length=500)
     metadata: Optional[dict] = None
+    version: Optional[int] = Field(
+        None, ge=1, description="Expected current version; stale updates are rejected"
+    )
 
 
 class ResourceResponse(ResourceBase):
     """Schema for resource response."""
     id: UUID
+    version: int = 1
     created_at: datetime
     updated_at: datetime
 
@@ -68,11 +93,19 @@ class ResourceResponse(ResourceBase):
 
 
 class PaginationMeta(BaseModel):
-    """Pagination metadata."""
-    page: int
+    """Pagination metadata.
+
+    Offset pages fill page, total and total_pages. Cursor pages fill
+    next_cursor/prev_cursor and only carry a total when one was requested;
+    it may then be a planner estimate (total_is_estimate).
+    """
+    page: Optional[int] = None
     limit: int
-    total: int
-    total_pages: int
+    total: Optional[int] = None
+    total_pages: Optional[int] = None
+    total_is_estimate: bool = False
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -81,6 +114,20 @@ class PaginatedResponse(BaseModel, Generic[T]):
     meta: PaginationMeta
 
 
+class CurrentUser(BaseModel):
+    """Authenticated user as seen by route handlers.
+
+    A plain snapshot rather than an ORM instance, so it can be cached
+    across requests and sessions.
+    """
+    id: str
+    role: str
+    token_version: int = 0
+
+    class Config:
+        from_attributes = True
+
+
 class ErrorDetail(BaseModel):
     """Error response schema."""
     code: str
@@ -93,6 +140,45 @@ class ErrorResponse(BaseModel):
     error: ErrorDetail
 
 
+BULK_MAX_ITEMS = 5000
+
+
+class ResourceUpsert(ResourceBase):
+    """Schema for a bulk upsert item (full replacement keyed by id)."""
+    id: UUID
+
+
+class BulkCreateRequest(BaseModel):
+    """Batch of resources to create."""
+    items: List[ResourceCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkUpsertRequest(BaseModel):
+    """Batch of resources to create or replace."""
+    items: List[ResourceUpsert] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkDeleteRequest(BaseModel):
+    """Batch of resource IDs to delete."""
+    ids: List[UUID] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    """Outcome for one item of a bulk request, by position in the request."""
+    index: int
+    id: UUID
+    status: int
+    data: Optional[ResourceResponse] = None
+    error: Optional[ErrorDetail] = None
+
+
+class BulkResponse(BaseModel):
+    """Per-item results of a bulk request."""
+    results: List[BulkItemResult]
+    succeeded: int
+    failed: int
+
+
 # ============================================================================
 # Exceptions
 # ============================================================================
@@ -135,6 +221,262 @@ class ApiError(HTTPException):
         return cls(409, message, "CONFLICT")
 
 
+# ============================================================================
+# Cursors
+# ============================================================================
+
+def encode_cursor(created_at: datetime, resource_id: UUID, direction: str = "next") -> str:
+    """Opaque cursor for the position (created_at, id) in a listing."""
+    payload = json.dumps(
+        {"c": created_at.isoformat(), "i": str(resource_id), "d": direction},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID, str]:
+    """Decode a cursor into (created_at, id, direction)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        direction = payload["d"]
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return datetime.fromisoformat(payload["c"]), UUID(payload["i"]), direction
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ApiError.bad_request("Invalid cursor")
+
+
+# ============================================================================
+# Caching
+# ============================================================================
+
+class CacheBackend(Protocol):
+    """Async key-value store for cached auth data (in-process, Redis, ...)."""
+
+    async def get(self, key: str) -> Optional[Any]: ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+
+class TTLCache:
+    """In-process LRU cache whose entries expire after a TTL.
+
+    Bounded to max_size entries; the least recently used entry is evicted
+    first. Safe to share between requests on one event loop.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Verified token payloads, keyed by token hash; never shared between processes
+token_cache = TTLCache(max_size=50_000, ttl=300.0)
+
+# CurrentUser snapshots keyed by subject; replace with configure_user_cache
+user_cache: CacheBackend = TTLCache(max_size=10_000, ttl=60.0)
+
+
+def configure_user_cache(backend: CacheBackend) -> None:
+    """Use another backend (e.g. Redis) so invalidations reach every worker."""
+    global user_cache
+    user_cache = backend
+
+
+async def invalidate_user(user_id: str) -> None:
+    """Drop a cached user.
+
+    Call after changing a user's role, disabling them or revoking their
+    tokens (bump token_version to also reject tokens already issued).
+    """
+    await user_cache.delete(f"user:{user_id}")
+
+
+def _token_key(token: str) -> str:
+    return "token:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Serialized GET responses with their strong ETags.
+
+    Resources are cached by id and listings by query string under a
+    generation number; every committed write drops the written resources
+    and bumps the generation, which retires all cached listings at once.
+    Entries are per process, so the TTL bounds staleness when several
+    workers run.
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 30.0):
+        self.entries = TTLCache(max_size=max_size, ttl=ttl)
+        self.generation = 0
+
+    @staticmethod
+    def resource_key(resource_id: UUID) -> str:
+        return f"resource:{resource_id}"
+
+    def list_key(self, request: Request) -> str:
+        query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+        return f"list:{self.generation}:{query}"
+
+    async def get(self, key: str) -> Optional[Tuple[str, bytes]]:
+        return await self.entries.get(key)
+
+    async def put(self, key: str, etag: str, body: bytes, generation: int) -> Tuple[str, bytes]:
+        """Store a response read while at generation, unless a write happened since."""
+        entry = (etag, body)
+        if generation == self.generation:
+            await self.entries.set(key, entry)
+        return entry
+
+    async def invalidate(self, *resource_ids: UUID) -> None:
+        self.generation += 1
+        for resource_id in resource_ids:
+            await self.entries.delete(self.resource_key(resource_id))
+
+
+response_cache = ResponseCache()
+
+WRITTEN_RESOURCES_KEY = "written_resources"
+
+
+def mark_written(session: AsyncSession, *resource_ids: UUID) -> None:
+    """Queue resources for cache invalidation once the session commits.
+
+    Invalidating before the commit would let a concurrent GET cache the
+    old committed row under the new generation.
+    """
+    session.info.setdefault(WRITTEN_RESOURCES_KEY, set()).update(resource_ids)
+
+
+async def invalidate_written(session: AsyncSession) -> None:
+    """Invalidate what a session wrote; call right after a successful commit."""
+    written = session.info.pop(WRITTEN_RESOURCES_KEY, None)
+    if written is not None:
+        await response_cache.invalidate(*written)
+
+
+def resource_etag(resource: ResourceResponse) -> str:
+    """Strong ETag from a resource's version and last update."""
+    return f'"{resource.id}.{resource.version}.{int(resource.updated_at.timestamp() * 1e6)}"'
+
+
+def body_etag(body: bytes) -> str:
+    """Strong ETag from the exact bytes of a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 requires for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in tags
+
+
+def conditional_response(entry: Tuple[str, bytes], if_none_match: Optional[str]) -> Response:
+    """304 if the client's copy is current, otherwise the cached body."""
+    etag, body = entry
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FastJSONResponse(content=body, headers=headers)
+
+
+# ============================================================================
+# Fast JSON
+# ============================================================================
+
+# Serialize list pages straight from DB records, skipping Pydantic. Only
+# enable it when rows always satisfy ResourceResponse (the database enforces
+# its constraints); the OpenAPI schema comes from response_model either way.
+FAST_LIST_SERIALIZATION = False
+
+RESOURCE_FIELDS = tuple(ResourceResponse.model_fields)
+RESOURCE_DEFAULTS = {
+    name: field.default
+    for name, field in ResourceResponse.model_fields.items()
+    if not field.is_required()
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Encode the non-JSON types in resource rows the way Pydantic does."""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump_json(content: Any) -> bytes:
+    """Compact JSON bytes, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(
+        content, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def resource_row(record: Any) -> Dict[str, Any]:
+    """Plain dict of a DB record's ResourceResponse fields, unvalidated."""
+    return {
+        name: getattr(record, name, RESOURCE_DEFAULTS.get(name))
+        for name in RESOURCE_FIELDS
+    }
+
+
+def serialize_page(page: PaginatedResponse) -> bytes:
+    """Same bytes as PaginatedResponse[ResourceResponse], without validation."""
+    return dump_json({
+        "data": [resource_row(record) for record in page.data],
+        "meta": page.meta.model_dump(),
+    })
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with dump_json; bytes are sent as they are.
+
+    Subclasses JSONResponse so that, as response_class, the route keeps its
+    response_model schema in OpenAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
+
+
 # ============================================================================
 # Dependencies
 # ============================================================================
@@ -154,42 +496,85 @@ async def get_db() -> AsyncSession:
         except Exception:
             await session.rollback()
             raise
+        # Only committed writes retire cached responses
+        await invalidate_written(session)
     """
     raise NotImplementedError("Implement database session")
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-):
-    """Get current authenticated user.
+def decode_token(token: str) -> dict:
+    """Verify a token's signature and expiry and return its payload.
 
     TODO: Implement JWT verification:
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
-            raise ApiError.unauthorized()
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
         raise ApiError.unauthorized("Invalid token")
+    """
+    raise NotImplementedError("Implement token verification")
+
+
+async def load_user(db: AsyncSession, user_id: str) -> Optional[CurrentUser]:
+    """Load a user snapshot from the database.
+
+    TODO: Implement with your ORM:
 
     user = await db.get(User, user_id)
-    if user is None:
+    if user is None or not user.is_active:
+        return None
+    return CurrentUser.model_validate(user)
+    """
+    raise NotImplementedError("Implement user lookup")
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> CurrentUser:
+    """Get current authenticated user.
+
+    Verified payloads are cached by token hash until the token expires, and
+    users by subject, so a repeated token costs neither a signature check
+    nor a query. The cached user is only used while its token_version
+    matches the token's "ver" claim.
+    """
+    token_key = _token_key(token)
+    payload = await token_cache.get(token_key)
+    if payload is None:
+        payload = decode_token(token)
+        ttl = token_cache.ttl
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            await token_cache.set(token_key, payload, ttl)
+
+    user_id = payload.get("sub")
+    if user_id is None:
         raise ApiError.unauthorized()
+    version = payload.get("ver", 0)
+
+    user_key = f"user:{user_id}"
+    user = await user_cache.get(user_key)
+    if user is None or user.token_version != version:
+        user = await load_user(db, user_id)
+        if user is None:
+            raise ApiError.unauthorized()
+        await user_cache.set(user_key, user)
+
+    if user.token_version != version:
+        # Token issued before the user's tokens were revoked
+        raise ApiError.unauthorized("Token revoked")
 
     return user
-    """
-    raise NotImplementedError("Implement authentication")
 
 
 def require_roles(*roles: str):
     """Role-based authorization dependency factory."""
 
-    async def check_role(current_user=Depends(get_current_user)):
-        # TODO: Check user.role against allowed roles
-        # if current_user.role not in roles:
-        #     raise ApiError.forbidden("Insufficient permissions")
+    async def check_role(current_user: CurrentUser = Depends(get_current_user)):
+        if current_user.role not in roles:
+            raise ApiError.forbidden("Insufficient permissions")
         return current_user
 
     return check_role
@@ -199,11 +584,134 @@ def require_roles(*roles: str):
 # Service Layer
 # ============================================================================
 
+# Exact counts per search term; bounded, since search comes from clients
+COUNT_CACHE_TTL = 30.0
+_count_cache = TTLCache(max_size=1_000, ttl=COUNT_CACHE_TTL)
+
+
+# Rows per multi-row statement in bulk writes
+BULK_CHUNK_SIZE = 500
+
+# Writes one chunk of rows and returns {id: written resource or None}
+ChunkWriter = Callable[[List[dict]], Awaitable[Dict[UUID, Optional[ResourceResponse]]]]
+
+
 class ResourceService:
     """Business logic for resources."""
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, bulk_chunk_size: int = BULK_CHUNK_SIZE):
         self.db = db
+        self.bulk_chunk_size = bulk_chunk_size
+
+    async def find_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 20,
+        search: Optional[str] = None,
+        with_total: bool = False,
+    ) -> PaginatedResponse[ResourceResponse]:
+        """List resources newest first with keyset pagination.
+
+        Each page is an index range scan from the cursor position, so its
+        cost does not grow with depth. Requires an index on
+        (created_at DESC, id DESC). The total is only computed on request.
+        """
+        created_at = resource_id = None
+        direction = "next"
+        if cursor:
+            created_at, resource_id, direction = decode_cursor(cursor)
+
+        # One extra row tells whether another page follows
+        rows = await self._fetch_keyset(created_at, resource_id, direction, limit + 1, search)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "prev":
+            # Fetched oldest first when walking backwards
+            rows.reverse()
+
+        next_cursor = prev_cursor = None
+        if rows:
+            if has_more or direction == "prev":
+                next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id, "next")
+            if cursor and (has_more or direction == "next"):
+                prev_cursor = encode_cursor(rows[0].created_at, rows[0].id, "prev")
+
+        total = None
+        estimate = False
+        if with_total:
+            total, estimate = await self._count(search)
+
+        # Rows stay DB records; the route validates or serializes them once
+        return PaginatedResponse.model_construct(
+            data=rows,
+            meta=PaginationMeta(
+                limit=limit,
+                total=total,
+                total_is_estimate=estimate,
+                next_cursor=next_cursor,
+                prev_cursor=prev_cursor,
+            ),
+        )
+
+    async def _fetch_keyset(
+        self,
+        created_at: Optional[datetime],
+        resource_id: Optional[UUID],
+        direction: str,
+        limit: int,
+        search: Optional[str],
+    ) -> List[ResourceResponse]:
+        """Fetch up to limit rows past a (created_at, id) position.
+
+        TODO: Implement with your ORM:
+
+        key = tuple_(Resource.created_at, Resource.id)
+        query = select(Resource)
+        if search:
+            query = query.where(Resource.name.ilike(f"%{search}%"))
+
+        if direction == "next":
+            if created_at is not None:
+                query = query.where(key < (created_at, resource_id))
+            query = query.order_by(Resource.created_at.desc(), Resource.id.desc())
+        else:
+            query = query.where(key > (created_at, resource_id))
+            query = query.order_by(Resource.created_at.asc(), Resource.id.asc())
+
+        result = await self.db.execute(query.limit(limit))
+        return list(result.scalars().all())
+        """
+        return []
+
+    async def _count(self, search: Optional[str]) -> Tuple[int, bool]:
+        """Total for a listing and whether it is an estimate.
+
+        Exact counts are cached for COUNT_CACHE_TTL seconds per search term.
+
+        TODO: Implement with your ORM:
+
+        if search is None:
+            # Planner statistics: O(1), refreshed by ANALYZE/autovacuum
+            estimate = await self.db.scalar(text(
+                "SELECT reltuples::bigint FROM pg_class WHERE relname = 'resources'"
+            ))
+            if estimate is not None and estimate >= 0:
+                return estimate, True
+
+        query = select(func.count()).select_from(Resource)
+        if search:
+            query = query.where(Resource.name.ilike(f"%{search}%"))
+        total = await self.db.scalar(query)
+        """
+        key = "count:" + json.dumps(search)
+        cached = await _count_cache.get(key)
+        if cached is not None:
+            return cached, False
+
+        total = 0
+
+        await _count_cache.set(key, total)
+        return total, False
 
     async def find_all(
         self,
@@ -211,7 +719,9 @@ class ResourceService:
         limit: int = 20,
         search: Optional[str] = None,
     ) -> PaginatedResponse[ResourceResponse]:
-        """List resources with pagination.
+        """List resources with offset pagination.
+
+        Deep pages scan and discard every preceding row; prefer find_page.
 
         TODO: Implement with your ORM:
 
@@ -230,7 +740,7 @@ class ResourceService:
         resources = []
         total = 0
 
-        return PaginatedResponse(
+        return PaginatedResponse.model_construct(
             data=resources,
             meta=PaginationMeta(
                 page=page,
@@ -240,6 +750,31 @@ class ResourceService:
             ),
         )
 
+    async def stream_all(
+        self, search: Optional[str] = None, batch_size: int = 1000
+    ) -> AsyncIterator[ResourceResponse]:
+        """Yield every resource, oldest first, from a server-side cursor.
+
+        Rows are fetched batch_size at a time as the consumer asks for
+        them, so memory stays constant however large the table is.
+
+        TODO: Implement with your ORM:
+
+        query = select(Resource).order_by(Resource.created_at, Resource.id)
+        if search:
+            query = query.where(Resource.name.ilike(f"%{search}%"))
+
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for resource in result.scalars():
+            yield resource
+
+        The session must stay open until the response has been sent; if your
+        get_db closes it when the handler returns, open a dedicated session
+        here (async with AsyncSessionLocal() as session) instead.
+        """
+        for resource in []:
+            yield resource
+
     async def find_by_id(self, resource_id: UUID) -> Optional[ResourceResponse]:
         """Find resource by ID.
 
@@ -258,55 +793,201 @@ class ResourceService:
         await self.db.flush()
         return resource
         """
-        return ResourceResponse(
+        resource = ResourceResponse(
             id=uuid4(),
             **data.model_dump(),
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow(),
         )
 
+        mark_written(self.db, resource.id)
+        return resource
+
     async def update(
         self, resource_id: UUID, data: ResourceUpdate
     ) -> Optional[ResourceResponse]:
-        """Update a resource.
+        """Update a resource in a single UPDATE ... RETURNING statement.
 
-        TODO: Implement with your ORM:
+        The row is matched, changed, version-bumped and returned atomically,
+        with no read before the write. If data.version is set the update
+        only applies while the row is still at that version; a stale
+        version raises a conflict.
 
-        resource = await self.db.get(Resource, resource_id)
-        if not resource:
-            return None
+        TODO: Implement with your ORM:
 
-        for key, value in data.model_dump(exclude_unset=True).items():
-            setattr(resource, key, value)
+        values = data.model_dump(exclude_unset=True, exclude={"version"})
+        stmt = (
+            update(Resource)
+            .where(Resource.id == resource_id)
+            .values(**values, version=Resource.version + 1, updated_at=func.now())
+            .returning(Resource)
+        )
+        if data.version is not None:
+            stmt = stmt.where(Resource.version == data.version)
+        resource = (await self.db.execute(stmt)).scalar_one_or_none()
+        """
+        resource = None
 
-        resource.updated_at = datetime.utcnow()
-        await self.db.flush()
+        if resource is None and data.version is not None:
+            await self._raise_if_exists(resource_id)
+        if resource is not None:
+            mark_written(self.db, resource_id)
         return resource
+
+    async def delete(self, resource_id: UUID, version: Optional[int] = None) -> bool:
+        """Delete a resource in a single DELETE ... RETURNING statement.
+
+        With version, only deletes the row while it is at that version.
+
+        TODO: Implement with your ORM:
+
+        stmt = delete(Resource).where(Resource.id == resource_id).returning(Resource.id)
+        if version is not None:
+            stmt = stmt.where(Resource.version == version)
+        deleted_id = (await self.db.execute(stmt)).scalar_one_or_none()
         """
-        existing = await self.find_by_id(resource_id)
-        if not existing:
-            return None
+        deleted_id = None
 
-        updated_data = existing.model_dump()
-        updated_data.update(data.model_dump(exclude_unset=True))
-        updated_data["updated_at"] = datetime.utcnow()
+        if deleted_id is None and version is not None:
+            await self._raise_if_exists(resource_id)
+        if deleted_id is not None:
+            mark_written(self.db, resource_id)
+        return deleted_id is not None
 
-        return ResourceResponse(**updated_data)
+    async def _raise_if_exists(self, resource_id: UUID) -> None:
+        """Tell a version conflict apart from a missing row after a failed write.
 
-    async def delete(self, resource_id: UUID) -> bool:
-        """Delete a resource.
+        Only runs on the failure path, so successful writes stay one
+        round trip.
 
         TODO: Implement with your ORM:
 
-        resource = await self.db.get(Resource, resource_id)
-        if not resource:
-            return False
+        found = await self.db.scalar(select(exists().where(Resource.id == resource_id)))
+        """
+        found = False
 
-        await self.db.delete(resource)
-        return True
+        if found:
+            raise ApiError.conflict("Resource was modified by another request")
+
+
+    async def bulk_create(self, items: List[ResourceCreate]) -> BulkResponse:
+        """Create resources with one multi-row INSERT per chunk."""
+        rows = [{"id": uuid4(), **item.model_dump()} for item in items]
+        return await self._write_chunked(rows, self._insert_rows, status.HTTP_201_CREATED)
+
+    async def bulk_upsert(self, items: List[ResourceUpsert]) -> BulkResponse:
+        """Create or replace resources with one multi-row UPSERT per chunk."""
+        rows = [item.model_dump() for item in items]
+        return await self._write_chunked(rows, self._upsert_rows, status.HTTP_200_OK)
+
+    async def bulk_delete(self, ids: List[UUID]) -> BulkResponse:
+        """Delete resources with one DELETE ... RETURNING per chunk."""
+        rows = [{"id": resource_id} for resource_id in ids]
+        return await self._write_chunked(rows, self._delete_rows, status.HTTP_200_OK)
+
+    async def _write_chunked(
+        self, rows: List[dict], write: ChunkWriter, success_status: int
+    ) -> BulkResponse:
+        """Write rows chunk by chunk, isolating failures to the rows causing them.
+
+        Each chunk runs in a savepoint. If the chunk fails only the
+        savepoint is rolled back and its rows are retried one at a time, so
+        a bad row fails alone and earlier chunks stay written. Rows the
+        statement did not touch (e.g. deleting an unknown id) are 404s.
+        """
+        results: List[BulkItemResult] = []
+
+        for start in range(0, len(rows), self.bulk_chunk_size):
+            chunk = rows[start:start + self.bulk_chunk_size]
+            failures: Dict[UUID, DBAPIError] = {}
+            try:
+                written = await self._in_savepoint(write, chunk)
+            except DBAPIError:
+                written = {}
+                for row in chunk:
+                    try:
+                        written.update(await self._in_savepoint(write, [row]))
+                    except DBAPIError as e:
+                        failures[row["id"]] = e
+
+            if written:
+                mark_written(self.db, *written)
+
+            for offset, row in enumerate(chunk):
+                item = BulkItemResult(index=start + offset, id=row["id"], status=success_status)
+                if row["id"] in written:
+                    item.data = written[row["id"]]
+                elif isinstance(failures.get(row["id"]), IntegrityError):
+                    item.status = status.HTTP_409_CONFLICT
+                    item.error = ErrorDetail(code="CONFLICT", message="Violates a database constraint")
+                elif row["id"] in failures:
+                    item.status = status.HTTP_400_BAD_REQUEST
+                    item.error = ErrorDetail(code="BAD_REQUEST", message="Rejected by the database")
+                else:
+                    item.status = status.HTTP_404_NOT_FOUND
+                    item.error = ErrorDetail(code="NOT_FOUND", message="Resource not found")
+                results.append(item)
+
+        failed = sum(1 for item in results if item.status >= 400)
+        return BulkResponse(results=results, succeeded=len(results) - failed, failed=failed)
+
+    async def _in_savepoint(
+        self, write: ChunkWriter, rows: List[dict]
+    ) -> Dict[UUID, Optional[ResourceResponse]]:
+        """Run a chunk write inside a savepoint.
+
+        TODO: Implement with your ORM:
+
+        async with self.db.begin_nested():
+            return await write(rows)
+        """
+        return await write(rows)
+
+    async def _insert_rows(self, rows: List[dict]) -> Dict[UUID, Optional[ResourceResponse]]:
+        """Multi-row INSERT ... RETURNING.
+
+        TODO: Implement with your ORM:
+
+        result = await self.db.execute(insert(Resource).values(rows).returning(Resource))
+        return {resource.id: resource for resource in result.scalars()}
+        """
+        now = datetime.utcnow()
+        return {
+            row["id"]: ResourceResponse(**row, created_at=now, updated_at=now)
+            for row in rows
+        }
+
+    async def _upsert_rows(self, rows: List[dict]) -> Dict[UUID, Optional[ResourceResponse]]:
+        """Multi-row INSERT ... ON CONFLICT (id) DO UPDATE ... RETURNING.
+
+        TODO: Implement with your ORM (PostgreSQL dialect insert):
+
+        stmt = pg_insert(Resource).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Resource.id],
+            set_={
+                "name": stmt.excluded.name,
+                "description": stmt.excluded.description,
+                "metadata": stmt.excluded.metadata,
+                "version": Resource.version + 1,
+                "updated_at": func.now(),
+            },
+        ).returning(Resource)
+        result = await self.db.execute(stmt)
+        return {resource.id: resource for resource in result.scalars()}
+        """
+        return await self._insert_rows(rows)
+
+    async def _delete_rows(self, rows: List[dict]) -> Dict[UUID, Optional[ResourceResponse]]:
+        """DELETE ... WHERE id IN (...) RETURNING id.
+
+        TODO: Implement with your ORM:
+
+        stmt = delete(Resource).where(Resource.id.in_([row["id"] for row in rows]))
+        result = await self.db.execute(stmt.returning(Resource.id))
+        return {resource_id: None for resource_id in result.scalars()}
         """
-        existing = await self.find_by_id(resource_id)
-        return existing is not None
+        return {}
 
 
 def get_resource_service(db: AsyncSession = Depends(get_db)) -> ResourceService:
@@ -324,37 +1005,146 @@ router = APIRouter(prefix="/resources", tags=["resources"])
 @router.get(
     "",
     response_model=PaginatedResponse[ResourceResponse],
+    response_class=FastJSONResponse,
     summary="List resources",
-    description="Get paginated list of resources with optional search.",
+    description=(
+        "Get paginated list of resources with optional search. Pages are "
+        "offset-based by default (slow for deep pages). Pass "
+        "pagination=cursor, then follow meta.next_cursor / meta.prev_cursor, "
+        "for keyset pagination. Supports If-None-Match."
+    ),
+    responses={304: {"description": "Not modified"}, 400: {"model": ErrorResponse}},
 )
 async def list_resources(
-    page: int = Query(1, ge=1, description="Page number"),
+    request: Request,
+    pagination: str = Query("offset", pattern="^(offset|cursor)$", description="offset or cursor"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (implies cursor pagination)"),
+    page: Optional[int] = Query(None, ge=1, description="Page number (offset pagination, default 1)"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     search: Optional[str] = Query(None, description="Search in name"),
+    with_total: bool = Query(False, description="Cursor pagination: include a (possibly estimated) total"),
+    if_none_match: Optional[str] = Header(None),
+    service: ResourceService = Depends(get_resource_service),
+    current_user=Depends(get_current_user),
+):
+    """List all resources with pagination.
+
+    Repeated requests are answered from the response cache, with a 304 when
+    the client already holds the current body.
+    """
+    key = response_cache.list_key(request)
+    generation = response_cache.generation
+    entry = await response_cache.get(key)
+
+    if entry is None:
+        if cursor is not None or pagination == "cursor":
+            if page is not None:
+                raise ApiError.bad_request("Use either cursor or page, not both")
+            result = await service.find_page(
+                cursor=cursor, limit=limit, search=search, with_total=with_total
+            )
+        else:
+            result = await service.find_all(page=page or 1, limit=limit, search=search)
+
+        if FAST_LIST_SERIALIZATION:
+            body = serialize_page(result)
+        else:
+            body = PaginatedResponse[ResourceResponse].model_validate(
+                result, from_attributes=True
+            ).model_dump_json().encode()
+        entry = await response_cache.put(key, body_etag(body), body, generation)
+
+    return conditional_response(entry, if_none_match)
+
+
+EXPORT_COLUMNS = ["id", "name", "description", "metadata", "version", "created_at", "updated_at"]
+
+# Encoded rows are sent in chunks of about this many bytes
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+async def _export_chunks(rows: AsyncIterator[ResourceResponse], fmt: str) -> AsyncIterator[bytes]:
+    """Encode rows as NDJSON or CSV, grouped into chunks for sending.
+
+    Each chunk is only produced once the previous one has been sent, so a
+    slow client slows down the database cursor instead of filling memory.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if fmt == "csv":
+        writer.writerow(EXPORT_COLUMNS)
+
+    async for row in rows:
+        resource = ResourceResponse.model_validate(row)
+        if fmt == "csv":
+            values = resource.model_dump(mode="json")
+            values["metadata"] = json.dumps(values["metadata"]) if values["metadata"] is not None else ""
+            writer.writerow([values[column] for column in EXPORT_COLUMNS])
+        else:
+            buffer.write(resource.model_dump_json())
+            buffer.write("\n")
+
+        if buffer.tell() >= EXPORT_CHUNK_BYTES:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+@router.get(
+    "/export",
+    summary="Export resources",
+    description="Stream every resource as NDJSON or CSV in a single response.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+    },
+)
+async def export_resources(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson or csv"),
+    search: Optional[str] = Query(None, description="Search in name"),
     service: ResourceService = Depends(get_resource_service),
     current_user=Depends(get_current_user),
 ):
-    """List all resources with pagination."""
-    return await service.find_all(page=page, limit=limit, search=search)
+    """Export all resources, streamed from a server-side cursor."""
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_chunks(service.stream_all(search=search), format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="resources.{format}"'},
+    )
 
 
 @router.get(
     "/{resource_id}",
     response_model=ResourceResponse,
     summary="Get resource",
-    description="Get a single resource by ID.",
-    responses={404: {"model": ErrorResponse}},
+    description="Get a single resource by ID. Supports If-None-Match.",
+    responses={304: {"description": "Not modified"}, 404: {"model": ErrorResponse}},
 )
 async def get_resource(
     resource_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     service: ResourceService = Depends(get_resource_service),
     current_user=Depends(get_current_user),
 ):
-    """Get resource by ID."""
-    resource = await service.find_by_id(resource_id)
-    if not resource:
-        raise ApiError.not_found("Resource")
-    return resource
+    """Get resource by ID, from the response cache when possible."""
+    key = response_cache.resource_key(resource_id)
+    generation = response_cache.generation
+    entry = await response_cache.get(key)
+
+    if entry is None:
+        resource = await service.find_by_id(resource_id)
+        if not resource:
+            raise ApiError.not_found("Resource")
+        resource = ResourceResponse.model_validate(resource)
+        entry = await response_cache.put(
+            key, resource_etag(resource), resource.model_dump_json().encode(), generation
+        )
+
+    return conditional_response(entry, if_none_match)
 
 
 @router.post(
@@ -374,12 +1164,60 @@ async def create_resource(
     return await service.create(data)
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Create resources in bulk",
+    description="Create up to BULK_MAX_ITEMS resources; each item gets its own result.",
+)
+async def bulk_create_resources(
+    data: BulkCreateRequest,
+    service: ResourceService = Depends(get_resource_service),
+    current_user=Depends(require_roles("admin", "editor")),
+):
+    """Create a batch of resources."""
+    return await service.bulk_create(data.items)
+
+
+@router.put(
+    "/bulk",
+    response_model=BulkResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Upsert resources in bulk",
+    description="Create or fully replace resources by ID; each item gets its own result.",
+)
+async def bulk_upsert_resources(
+    data: BulkUpsertRequest,
+    service: ResourceService = Depends(get_resource_service),
+    current_user=Depends(require_roles("admin", "editor")),
+):
+    """Create or replace a batch of resources."""
+    return await service.bulk_upsert(data.items)
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkResponse,
+    status_code=status.HTTP_207_MULTI_STATUS,
+    summary="Delete resources in bulk",
+    description="Delete resources by ID; unknown IDs are reported as 404 items.",
+)
+async def bulk_delete_resources(
+    data: BulkDeleteRequest,
+    service: ResourceService = Depends(get_resource_service),
+    current_user=Depends(require_roles("admin")),
+):
+    """Delete a batch of resources."""
+    return await service.bulk_delete(data.ids)
+
+
 @router.patch(
     "/{resource_id}",
     response_model=ResourceResponse,
     summary="Update resource",
-    description="Update an existing resource.",
-    responses={404: {"model": ErrorResponse}},
+    description="Update an existing resource. Send version to reject stale updates.",
+    responses={404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},
 )
 async def update_resource(
     resource_id: UUID,
@@ -398,16 +1236,17 @@ async def update_resource(
     "/{resource_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete resource",
-    description="Delete a resource by ID.",
-    responses={404: {"model": ErrorResponse}},
+    description="Delete a resource by ID, optionally only at a given version.",
+    responses={404: {"model": ErrorResponse}, 409: {"model": ErrorResponse}},
 )
 async def delete_resource(
     resource_id: UUID,
+    version: Optional[int] = Query(None, ge=1, description="Expected current version"),
     service: ResourceService = Depends(get_resource_service),
     current_user=Depends(require_roles("admin")),
 ):
     """Delete resource by ID."""
-    deleted = await service.delete(resource_id)
+    deleted = await service.delete(resource_id, version=version)
     if not deleted:
         raise ApiError.not_found("Resource")
 
@@ -416,8 +1255,7 @@ async def delete_resource(
 # Exception Handler
 # ============================================================================
 
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI
 
 
 def register_exception_handlers(app: FastAPI):
@@ -6,23 +6,41 @@ Scans backend code for common security vulnerabilities based on OWASP Top 10.
 Supports JavaScript/TypeScript, Python, and Go codebases.
 
 Usage:
-    python security_audit.py <directory> [--severity <level>] [--format <format>]
+    python security_audit.py <directory> [--severity <level>] [--format <format>] [--jobs <n>]
 
 Examples:
     python security_audit.py ./src
     python security_audit.py ./src --severity high
     python security_audit.py ./src --format json
+    python security_audit.py ./src --jobs 0
+    python security_audit.py ./src --cache .security-audit-cache.json
+    python security_audit.py ./src --watch
+    python security_audit.py ./src --profile text --profile-top 10
+    python security_audit.py ./src --format ndjson --output findings.ndjson
+    python security_audit.py ./src --format sarif --stream --output results.sarif
+    python security_audit.py . --since origin/main --changed-lines
+    python security_audit.py . --staged --exit-code
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import errno
+import hashlib
 import json
 import os
 import re
+import select
+import struct
+import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import Iterator, List, Optional, Dict, Pattern, Set, TextIO, Tuple
 
 
 class Severity(Enum):
@@ -333,6 +351,178 @@ EXTENSION_MAP = {
 }
 
 
+# Combined prefilter and (compiled pattern, definition) pairs for one group
+RuleGroup = Tuple[Optional[Pattern], List[Tuple[Pattern, dict]]]
+
+# Directories to skip
+SKIP_DIRS = {
+    "node_modules", "vendor", "venv", ".venv", "__pycache__",
+    ".git", ".svn", "dist", "build", ".next", "coverage",
+}
+
+
+def in_skipped_dir(path: Path, root: Path) -> bool:
+    """Whether a path lies in one of SKIP_DIRS below root (root itself may be anywhere)."""
+    try:
+        parts = path.relative_to(root).parts[:-1]
+    except ValueError:
+        return False
+    return not SKIP_DIRS.isdisjoint(parts)
+
+
+# ============================================================================
+# Findings Cache
+# ============================================================================
+
+def finding_to_dict(finding: Finding) -> dict:
+    """Serialize a finding to a JSON-compatible dict."""
+    return {**asdict(finding), "severity": finding.severity.value}
+
+
+def finding_from_dict(data: dict, file: Optional[str] = None) -> Finding:
+    """Rebuild a finding from its dict form, optionally for another file."""
+    return Finding(**{
+        **data,
+        "file": file if file is not None else data["file"],
+        "severity": Severity(data["severity"]),
+    })
+
+
+class FindingsCache:
+    """On-disk cache of per-file findings keyed by content hash.
+
+    Entries are only valid for the fingerprint they were written with (rule
+    table plus severity threshold); a mismatching cache file is discarded on
+    load. The least recently used entries are evicted beyond max_entries.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, fingerprint: str, max_entries: int = 50000):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.entries: Dict[str, List[dict]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        """Load entries from disk, ignoring missing or stale cache files."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if (
+            data.get("version") == self.VERSION
+            and data.get("fingerprint") == self.fingerprint
+        ):
+            self.entries = data.get("entries", {})
+
+    def save(self) -> None:
+        """Evict old entries and write the cache atomically."""
+        excess = len(self.entries) - self.max_entries
+        if excess > 0:
+            for key in list(self.entries)[:excess]:
+                del self.entries[key]
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({
+                "version": self.VERSION,
+                "fingerprint": self.fingerprint,
+                "entries": self.entries,
+            }),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        """Return cached findings for a key and mark it recently used."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries[key] = entry
+        self.hits += 1
+        return entry
+
+    def touch(self, key: str) -> None:
+        """Count a hit served from a worker's copy and mark the key recently used."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.entries[key] = entry
+            self.hits += 1
+
+    def put(self, key: str, findings: List[Finding]) -> None:
+        """Store findings for a key, without their file path."""
+        self.entries.pop(key, None)
+        self.entries[key] = [
+            {k: v for k, v in finding_to_dict(f).items() if k != "file"}
+            for f in findings
+        ]
+
+
+# ============================================================================
+# Rule Profiling
+# ============================================================================
+
+# Each script is standalone, so this class is copied verbatim into
+# security_audit.py, sql_analyzer.py and performance_audit.py: keep the
+# copies identical.
+
+class RuleProfile:
+    """Time spent, lines evaluated and matches per rule across a scan."""
+
+    def __init__(self):
+        # (table, rule) -> [seconds, lines evaluated, matches]
+        self.stats: Dict[Tuple[str, str], list] = {}
+
+    def record(self, table: str, rule: str, seconds: float, evaluated: int, matches: int) -> None:
+        """Add one measurement for a rule."""
+        entry = self.stats.setdefault((table, rule), [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += evaluated
+        entry[2] += matches
+
+    def top(self, limit: Optional[int] = None) -> List[dict]:
+        """Rules ordered by total time, most expensive first."""
+        rows = [
+            {
+                "table": table,
+                "rule": rule,
+                "seconds": round(seconds, 6),
+                "evaluated": evaluated,
+                "matches": matches,
+                "us_per_line": round(seconds / evaluated * 1e6, 3) if evaluated else 0.0,
+            }
+            for (table, rule), (seconds, evaluated, matches) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def report_text(self, limit: Optional[int] = None) -> str:
+        """Format the hottest rules as a table."""
+        lines = [
+            "=" * 90,
+            "RULE PROFILE",
+            "=" * 90,
+            f"{'ms':>9} {'us/line':>8} {'lines':>9} {'matches':>8}  rule",
+            "-" * 90,
+        ]
+        for row in self.top(limit):
+            lines.append(
+                f"{row['seconds'] * 1000:9.2f} {row['us_per_line']:8.2f} "
+                f"{row['evaluated']:9d} {row['matches']:8d}  {row['table']}: {row['rule']}"
+            )
+        lines.append("=" * 90)
+        return "\n".join(lines)
+
+    def report_json(self, limit: Optional[int] = None) -> str:
+        """Format the hottest rules as JSON."""
+        return json.dumps({"rules": self.top(limit)}, indent=2)
+
+
 # ============================================================================
 # Scanner
 # ============================================================================
@@ -340,8 +530,15 @@ EXTENSION_MAP = {
 class SecurityScanner:
     """Scans code for security vulnerabilities."""
 
-    def __init__(self, min_severity: Severity = Severity.INFO):
+    def __init__(
+        self,
+        min_severity: Severity = Severity.INFO,
+        cache: Optional[FindingsCache] = None,
+        profile: Optional[RuleProfile] = None,
+    ):
         self.min_severity = min_severity
+        self.cache = cache
+        self.profile = profile
         self.severity_order = [
             Severity.INFO,
             Severity.LOW,
@@ -349,65 +546,229 @@ class SecurityScanner:
             Severity.HIGH,
             Severity.CRITICAL,
         ]
+        self.rule_groups = {
+            group: self._compile_group(pattern_defs)
+            for group, pattern_defs in PATTERNS.items()
+        }
 
     def should_report(self, severity: Severity) -> bool:
         """Check if severity meets minimum threshold."""
         return self.severity_order.index(severity) >= self.severity_order.index(self.min_severity)
 
-    def scan_file(self, file_path: Path) -> List[Finding]:
+    def _compile_group(self, pattern_defs: List[dict]) -> RuleGroup:
+        """Compile the reportable patterns of a group plus a combined prefilter.
+
+        The prefilter is a single alternation of every rule: a line that does
+        not match it cannot match any individual rule, so most lines are
+        rejected with one regex call instead of one per rule.
+        """
+        rules = [
+            (re.compile(p["pattern"], re.IGNORECASE), p)
+            for p in pattern_defs
+            if self.should_report(p["severity"])
+        ]
+        if not rules:
+            return None, []
+
+        prefilter = re.compile(
+            "|".join(f"(?:{p['pattern']})" for _, p in rules),
+            re.IGNORECASE,
+        )
+        return prefilter, rules
+
+    def fingerprint(self) -> str:
+        """Hash of the rule table and severity threshold, used to key caches."""
+        payload = json.dumps(
+            {
+                "min_severity": self.min_severity.value,
+                "extensions": EXTENSION_MAP,
+                "patterns": {
+                    group: [
+                        {**p, "severity": p["severity"].value}
+                        for p in pattern_defs
+                    ]
+                    for group, pattern_defs in PATTERNS.items()
+                },
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def scan_file(self, file_path: Path, content_key: Optional[str] = None) -> List[Finding]:
         """Scan a single file for vulnerabilities."""
-        findings = []
+        key, findings, fresh = self._scan_file(file_path, content_key)
+        if fresh and key is not None:
+            self.cache.put(key, findings)
+        return findings
+
+    def _scan_file(
+        self, file_path: Path, content_key: Optional[str] = None
+    ) -> Tuple[Optional[str], List[Finding], bool]:
+        """Scan a file, consulting the cache if one is configured.
 
+        A content_key already computed for the file is reused as the cache
+        key instead of hashing the content again. Returns the cache key (None
+        without a cache), the findings and whether they were freshly computed
+        and should be stored.
+        """
         ext = file_path.suffix.lower()
         if ext not in EXTENSION_MAP:
-            return findings
+            return None, [], False
 
         pattern_group = EXTENSION_MAP[ext]
-        patterns = PATTERNS.get(pattern_group, [])
+        _, rules = self.rule_groups.get(pattern_group, (None, []))
+        if not rules:
+            return None, [], False
 
         try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore")
-            lines = content.split("\n")
+            data = file_path.read_bytes()
         except Exception:
+            return None, [], False
+
+        key = None
+        if self.cache is not None:
+            key = content_key or f"{pattern_group}:{hashlib.sha256(data).hexdigest()}"
+            cached = self.cache.get(key)
+            if cached is not None:
+                return key, [finding_from_dict(d, str(file_path)) for d in cached], False
+
+        # Same decoding as read_text(errors="ignore") with universal newlines
+        content = data.decode("utf-8", errors="ignore")
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        return key, self.scan_content(str(file_path), content, pattern_group), True
+
+    def scan_content(self, file: str, content: str, pattern_group: str) -> List[Finding]:
+        """Scan already-decoded source text with one pattern group."""
+        findings = []
+
+        prefilter, rules = self.rule_groups.get(pattern_group, (None, []))
+        if not rules:
             return findings
 
-        for pattern_def in patterns:
-            pattern = re.compile(pattern_def["pattern"], re.IGNORECASE)
+        lines = content.split("\n")
 
+        if self.profile is not None:
+            hits = self._match_profiled(pattern_group, lines, prefilter, rules)
+        else:
+            # Single pass over the file; matching lines are confirmed per rule
+            hits = [[] for _ in rules]
             for line_num, line in enumerate(lines, 1):
-                if pattern.search(line):
-                    severity = pattern_def["severity"]
-                    if self.should_report(severity):
-                        findings.append(Finding(
-                            file=str(file_path),
-                            line=line_num,
-                            severity=severity,
-                            category=pattern_def["category"],
-                            title=pattern_def["title"],
-                            description=pattern_def["description"],
-                            recommendation=pattern_def["recommendation"],
-                            code_snippet=line.strip()[:100],
-                        ))
+                if not prefilter.search(line):
+                    continue
+                for index, (pattern, _) in enumerate(rules):
+                    if pattern.search(line):
+                        hits[index].append(line_num)
+
+        # Emit rule by rule to keep the established report ordering
+        for (_, pattern_def), line_nums in zip(rules, hits):
+            for line_num in line_nums:
+                findings.append(Finding(
+                    file=file,
+                    line=line_num,
+                    severity=pattern_def["severity"],
+                    category=pattern_def["category"],
+                    title=pattern_def["title"],
+                    description=pattern_def["description"],
+                    recommendation=pattern_def["recommendation"],
+                    code_snippet=lines[line_num - 1].strip()[:100],
+                ))
 
         return findings
 
-    def scan_directory(self, directory: Path) -> List[Finding]:
-        """Scan a directory recursively for vulnerabilities."""
-        findings = []
+    def _match_profiled(
+        self,
+        pattern_group: str,
+        lines: List[str],
+        prefilter: Pattern,
+        rules: List[Tuple[Pattern, dict]],
+    ) -> List[List[int]]:
+        """Match rules one at a time over every line, timing each of them.
 
-        # Directories to skip
-        skip_dirs = {
-            "node_modules", "vendor", "venv", ".venv", "__pycache__",
-            ".git", ".svn", "dist", "build", ".next", "coverage",
-        }
+        The prefilter is timed as its own entry and not used to skip lines,
+        so each rule's cost is its standalone cost; the matched lines are the
+        same as in the normal path.
+        """
+        clock = time.perf_counter
+        table = f"PATTERNS[{pattern_group}]"
+
+        start = clock()
+        candidates = sum(1 for line in lines if prefilter.search(line))
+        self.profile.record(table, "<prefilter>", clock() - start, len(lines), candidates)
 
+        hits: List[List[int]] = []
+        for pattern, pattern_def in rules:
+            start = clock()
+            line_nums = [
+                line_num for line_num, line in enumerate(lines, 1)
+                if pattern.search(line)
+            ]
+            self.profile.record(
+                table, pattern_def["title"], clock() - start, len(lines), len(line_nums)
+            )
+            hits.append(line_nums)
+
+        return hits
+
+    def iter_files(self, directory: Path) -> Iterator[Path]:
+        """Yield scannable files under a directory in walk order."""
         for root, dirs, files in os.walk(directory):
             # Skip excluded directories
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
 
             for file in files:
                 file_path = Path(root) / file
-                findings.extend(self.scan_file(file_path))
+                if file_path.suffix.lower() in EXTENSION_MAP:
+                    yield file_path
+
+    def content_key(self, file_path: Path) -> Optional[str]:
+        """Key identifying a file's pattern group and exact content."""
+        ext = file_path.suffix.lower()
+        if ext not in EXTENSION_MAP:
+            return None
+        try:
+            digest = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        except Exception:
+            return None
+        return f"{EXTENSION_MAP[ext]}:{digest}"
+
+    def dedup_keys(self, files: List[Path]) -> List[str]:
+        """Keys under which files are deduplicated, one per file.
+
+        Only files sharing a pattern group and size can be identical, so only
+        those are read and hashed (with content_key); every other file, and
+        any file that cannot be read, is keyed by its path.
+        """
+        sizes: List[Optional[Tuple[str, int]]] = []
+        for file_path in files:
+            try:
+                sizes.append((EXTENSION_MAP[file_path.suffix.lower()], file_path.stat().st_size))
+            except OSError:
+                sizes.append(None)
+
+        counts = Counter(sizes)
+        return [
+            (size is not None and counts[size] > 1 and self.content_key(file_path))
+            or f"path:{file_path}"
+            for file_path, size in zip(files, sizes)
+        ]
+
+    def scan_directory(
+        self,
+        directory: Path,
+        jobs: int = 1,
+        paths: Optional[List[Path]] = None,
+    ) -> List[Finding]:
+        """Scan a directory recursively for vulnerabilities.
+
+        Returns every finding, critical first. See iter_findings for how
+        files are selected, deduplicated and sharded.
+        """
+        findings = [
+            finding
+            for file_findings in self.iter_findings(directory, jobs, paths)
+            for finding in file_findings
+        ]
 
         # Sort by severity (critical first)
         findings.sort(
@@ -417,6 +778,111 @@ class SecurityScanner:
 
         return findings
 
+    def iter_findings(
+        self,
+        directory: Path,
+        jobs: int = 1,
+        paths: Optional[List[Path]] = None,
+    ) -> Iterator[List[Finding]]:
+        """Yield the findings of each file under a directory in walk order.
+
+        If paths is given, only those files are scanned instead of walking
+        the directory. Byte-identical files (vendored or generated copies) are scanned once
+        and their findings reported for every copy. With jobs > 1 files are
+        sharded across a process pool. Results are consumed in submission
+        order, so the output is identical to a serial run, and each file's
+        findings are yielded as soon as they are available.
+        """
+        if paths is None:
+            files = list(self.iter_files(directory))
+        else:
+            files = [
+                file_path for file_path in paths
+                if file_path.suffix.lower() in EXTENSION_MAP
+                and not in_skipped_dir(file_path, directory)
+            ]
+
+        keys = self.dedup_keys(files)
+        remaining: Dict[str, int] = {}
+        unique_files = []
+        # Content hashes double as cache keys, so no file is hashed twice
+        content_keys: List[Optional[str]] = []
+        for file_path, key in zip(files, keys):
+            if key not in remaining:
+                remaining[key] = 0
+                unique_files.append(file_path)
+                content_keys.append(None if key.startswith("path:") else key)
+            remaining[key] += 1
+
+        if jobs > 1 and len(unique_files) > 1:
+            results = self._scan_parallel(unique_files, content_keys, jobs)
+        else:
+            results = (
+                self.scan_file(file_path, content_key)
+                for file_path, content_key in zip(unique_files, content_keys)
+            )
+
+        # Findings kept only while copies of their file are still to come
+        shared: Dict[str, List[Finding]] = {}
+        for file_path, key in zip(files, keys):
+            remaining[key] -= 1
+            if key in shared:
+                file_findings = shared[key] if remaining[key] else shared.pop(key)
+                yield [replace(f, file=str(file_path)) for f in file_findings]
+            else:
+                file_findings = next(results)
+                if remaining[key]:
+                    shared[key] = file_findings
+                yield file_findings
+
+    def _scan_parallel(
+        self, files: List[Path], content_keys: List[Optional[str]], jobs: int
+    ) -> Iterator[List[Finding]]:
+        """Scan files in worker processes, yielding findings per file in order."""
+        # Several chunks per worker keeps the pool balanced without paying
+        # IPC overhead for every small file.
+        chunksize = max(1, len(files) // (jobs * 4))
+
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_worker,
+            initargs=(self.min_severity, self.cache),
+        ) as pool:
+            results = pool.map(_scan_worker, files, content_keys, chunksize=chunksize)
+            for key, file_findings, fresh in results:
+                # Workers only read their copy of the cache; replay their
+                # hits and misses here so LRU order and new entries persist
+                if key is not None:
+                    if fresh:
+                        self.cache.misses += 1
+                        self.cache.put(key, file_findings)
+                    else:
+                        self.cache.touch(key)
+                yield file_findings
+
+    def reportable_rules(self) -> List[dict]:
+        """Pattern definitions at or above the severity threshold."""
+        return [
+            pattern_def
+            for _, rules in self.rule_groups.values()
+            for _, pattern_def in rules
+        ]
+
+
+# Per-process scanner used by pool workers
+_worker_scanner: Optional[SecurityScanner] = None
+
+
+def _init_worker(min_severity: Severity, cache: Optional[FindingsCache]) -> None:
+    global _worker_scanner
+    _worker_scanner = SecurityScanner(min_severity=min_severity, cache=cache)
+
+
+def _scan_worker(
+    file_path: Path, content_key: Optional[str]
+) -> Tuple[Optional[str], List[Finding], bool]:
+    return _worker_scanner._scan_file(file_path, content_key)
+
 
 # ============================================================================
 # Reporters
@@ -486,7 +952,7 @@ def report_json(findings: List[Finding]) -> str:
         {
             "total": len(findings),
             "findings": [
-                {**asdict(f), "severity": f.severity.value}
+                finding_to_dict(f)
                 for f in findings
             ],
         },
@@ -494,52 +960,75 @@ def report_json(findings: List[Finding]) -> str:
     )
 
 
+SARIF_LEVELS = {
+    Severity.CRITICAL: "error",
+    Severity.HIGH: "error",
+    Severity.MEDIUM: "warning",
+    Severity.LOW: "note",
+    Severity.INFO: "note",
+}
+
+
+def sarif_rule_id(category: str, title: str) -> str:
+    """Stable SARIF rule id derived from a rule's category and title."""
+    return f"{category.replace(' ', '_')}_{title.replace(' ', '_')}"
+
+
+def sarif_rule(rule_id: str, severity: Severity, title: str, description: str, recommendation: str) -> dict:
+    """SARIF reportingDescriptor for a rule."""
+    return {
+        "id": rule_id,
+        "name": title,
+        "shortDescription": {"text": title},
+        "fullDescription": {"text": description},
+        "help": {"text": recommendation},
+        "defaultConfiguration": {"level": SARIF_LEVELS[severity]},
+    }
+
+
+def sarif_result(f: Finding, rule_id: str, level: str) -> dict:
+    """SARIF result for a finding."""
+    return {
+        "ruleId": rule_id,
+        "level": level,
+        "message": {"text": f"{f.description}. {f.recommendation}"},
+        "locations": [{
+            "physicalLocation": {
+                "artifactLocation": {"uri": f.file},
+                "region": {"startLine": f.line},
+            }
+        }],
+    }
+
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_DRIVER = {"name": "security-audit", "version": "1.0.0"}
+
+
 def report_sarif(findings: List[Finding]) -> str:
     """Generate SARIF report for GitHub integration."""
     rules = {}
     results = []
 
     for f in findings:
-        rule_id = f"{f.category.replace(' ', '_')}_{f.title.replace(' ', '_')}"
+        rule_id = sarif_rule_id(f.category, f.title)
 
         if rule_id not in rules:
-            rules[rule_id] = {
-                "id": rule_id,
-                "name": f.title,
-                "shortDescription": {"text": f.title},
-                "fullDescription": {"text": f.description},
-                "help": {"text": f.recommendation},
-                "defaultConfiguration": {
-                    "level": {
-                        "critical": "error",
-                        "high": "error",
-                        "medium": "warning",
-                        "low": "note",
-                        "info": "note",
-                    }.get(f.severity.value, "warning")
-                },
-            }
+            rules[rule_id] = sarif_rule(
+                rule_id, f.severity, f.title, f.description, f.recommendation
+            )
 
-        results.append({
-            "ruleId": rule_id,
-            "level": rules[rule_id]["defaultConfiguration"]["level"],
-            "message": {"text": f"{f.description}. {f.recommendation}"},
-            "locations": [{
-                "physicalLocation": {
-                    "artifactLocation": {"uri": f.file},
-                    "region": {"startLine": f.line},
-                }
-            }],
-        })
+        results.append(sarif_result(
+            f, rule_id, rules[rule_id]["defaultConfiguration"]["level"]
+        ))
 
     sarif = {
-        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "$schema": SARIF_SCHEMA,
         "version": "2.1.0",
         "runs": [{
             "tool": {
                 "driver": {
-                    "name": "security-audit",
-                    "version": "1.0.0",
+                    **SARIF_DRIVER,
                     "rules": list(rules.values()),
                 }
             },
@@ -550,6 +1039,377 @@ def report_sarif(findings: List[Finding]) -> str:
     return json.dumps(sarif, indent=2)
 
 
+class NdjsonWriter:
+    """Writes each finding as one JSON line as soon as it is produced."""
+
+    def __init__(self, out: TextIO):
+        self.out = out
+
+    def write(self, findings: List[Finding]) -> None:
+        for f in findings:
+            self.out.write(json.dumps(finding_to_dict(f)) + "\n")
+        self.out.flush()
+
+    def close(self) -> None:
+        self.out.flush()
+
+
+class SarifWriter:
+    """Writes a SARIF log whose results array is filled in incrementally.
+
+    The rule table is known before scanning, so the driver section is
+    written up front and results are appended one line each; only the
+    closing brackets are written at the end.
+    """
+
+    def __init__(self, out: TextIO, pattern_defs: List[dict]):
+        self.out = out
+        self.levels: Dict[str, str] = {}
+        rules = []
+        for p in pattern_defs:
+            rule_id = sarif_rule_id(p["category"], p["title"])
+            if rule_id not in self.levels:
+                self.levels[rule_id] = SARIF_LEVELS[p["severity"]]
+                rules.append(sarif_rule(
+                    rule_id, p["severity"], p["title"], p["description"], p["recommendation"]
+                ))
+
+        tool = json.dumps({"driver": {**SARIF_DRIVER, "rules": rules}})
+        self.out.write(
+            f'{{"$schema": {json.dumps(SARIF_SCHEMA)}, "version": "2.1.0", '
+            f'"runs": [{{"tool": {tool}, "results": [\n'
+        )
+        self.first = True
+
+    def write(self, findings: List[Finding]) -> None:
+        for f in findings:
+            rule_id = sarif_rule_id(f.category, f.title)
+            level = self.levels.get(rule_id) or SARIF_LEVELS[f.severity]
+            separator = "" if self.first else ",\n"
+            self.out.write(separator + json.dumps(sarif_result(f, rule_id, level)))
+            self.first = False
+        self.out.flush()
+
+    def close(self) -> None:
+        self.out.write("\n]}]}\n")
+        self.out.flush()
+
+
+# ============================================================================
+# Watch Mode
+# ============================================================================
+
+class PollingWatcher:
+    """Detects changed files by comparing mtime/size snapshots."""
+
+    def __init__(self, scanner: SecurityScanner, directory: Path, interval: float = 1.0):
+        self.scanner = scanner
+        self.directory = directory
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for file_path in self.scanner.iter_files(self.directory):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait(self) -> Optional[Set[Path]]:
+        """Block for one interval and return paths created, modified or removed."""
+        time.sleep(self.interval)
+        current = self._snapshot()
+        changed = {
+            path for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher over a directory tree, via libc and ctypes.
+
+    wait() returns the set of changed paths, or None when the kernel event
+    queue overflowed and a full rescan is required. A directory removed or
+    moved out of the tree is returned as its own path, standing for every
+    file that was under it.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+
+    WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, directory: Path, settle: float = 0.2):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.settle = settle
+        self.watches: Dict[int, Path] = {}
+        try:
+            self._add_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, directory: Path) -> None:
+        for root, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+            wd = self.libc.inotify_add_watch(
+                self.fd, os.fsencode(root), self.WATCH_MASK
+            )
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err in (errno.ENOENT, errno.ENOTDIR):
+                    # Removed since it was listed (e.g. a short-lived temp dir)
+                    continue
+                # ENOSPC means fs.inotify.max_user_watches is exhausted
+                raise OSError(err, f"inotify_add_watch failed for {root}")
+            self.watches[wd] = Path(root)
+
+    def _remove_tree(self, directory: Path) -> None:
+        """Stop watching a directory and everything below it."""
+        for wd, path in list(self.watches.items()):
+            if path == directory or directory in path.parents:
+                del self.watches[wd]
+                # The kernel answers with IN_IGNORED for a wd we no longer map
+                self.libc.inotify_rm_watch(self.fd, wd)
+
+    def wait(self) -> Optional[Set[Path]]:
+        """Block until files change, then collect events until they settle."""
+        changed: Set[Path] = set()
+        timeout = None
+
+        while True:
+            ready, _, _ = select.select([self.fd], [], [], timeout)
+            if not ready:
+                return changed
+            # Keep reading while events arrive in quick succession (editors
+            # often write a file in several steps)
+            timeout = self.settle
+
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_len = self._EVENT.unpack_from(data, offset)
+                offset += self._EVENT.size
+                name = data[offset:offset + name_len].rstrip(b"\0")
+                offset += name_len
+
+                if mask & self.IN_Q_OVERFLOW:
+                    return None
+                if mask & self.IN_IGNORED:
+                    # Watch removed: its directory was deleted or unmounted
+                    self.watches.pop(wd, None)
+                    continue
+
+                parent = self.watches.get(wd)
+                if parent is None or not name:
+                    continue
+                path = parent / os.fsdecode(name)
+
+                if mask & self.IN_ISDIR:
+                    if mask & (self.IN_CREATE | self.IN_MOVED_TO) and path.name not in SKIP_DIRS:
+                        # New subtree: watch it and treat its files as changed
+                        self._add_tree(path)
+                        changed.update(p for p in path.rglob("*") if p.is_file())
+                    elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                        # Subtree gone: its watches are stale, its files resolved
+                        self._remove_tree(path)
+                        changed.add(path)
+                    continue
+
+                changed.add(path)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def watch_directory(
+    scanner: SecurityScanner,
+    directory: Path,
+    out=None,
+    poll_interval: float = 1.0,
+    use_inotify: bool = True,
+) -> None:
+    """Scan a directory, then rescan changed files and emit delta findings.
+
+    Each output line is a JSON object: a finding (as in report_json) with an
+    "event" of "added" or "resolved", or a {"event": "scan_complete"} marker
+    after the initial scan and after every batch of changes.
+    """
+    out = out or sys.stdout
+    state: Dict[Path, List[Finding]] = {}
+
+    def emit(event: str, finding: Optional[Finding] = None, **extra) -> None:
+        record = {"event": event, **(finding_to_dict(finding) if finding else {}), **extra}
+        out.write(json.dumps(record) + "\n")
+
+    def identity(finding: Finding) -> Tuple[str, str, str, str]:
+        # Line numbers are left out, so inserting a line above a finding
+        # does not report it as resolved and added again
+        return finding.category, finding.title, finding.file, finding.code_snippet
+
+    def rescan(paths) -> None:
+        for file_path in paths:
+            old = state.pop(file_path, [])
+            new = scanner.scan_file(file_path)
+            if new:
+                state[file_path] = new
+            # Positive counts are resolved findings, negative ones added
+            surplus = Counter(map(identity, old))
+            surplus.subtract(map(identity, new))
+            for finding in old:
+                if surplus[identity(finding)] > 0:
+                    surplus[identity(finding)] -= 1
+                    emit("resolved", finding)
+            for finding in new:
+                if surplus[identity(finding)] < 0:
+                    surplus[identity(finding)] += 1
+                    emit("added", finding)
+
+    # Watch before the initial scan, so edits made while it runs are not missed
+    watcher = None
+    if use_inotify:
+        try:
+            watcher = InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), falling back to polling", file=sys.stderr)
+    if watcher is None:
+        watcher = PollingWatcher(scanner, directory, poll_interval)
+
+    try:
+        files = list(scanner.iter_files(directory))
+        rescan(files)
+        emit("scan_complete", files=len(files))
+        out.flush()
+
+        while True:
+            changed = watcher.wait()
+            if changed is None:
+                # Events were lost: rescan everything still or previously known
+                changed = set(scanner.iter_files(directory)) | set(state)
+            # A removed directory stands for every file known under it
+            gone = {p for p in changed if not p.is_file()}
+            if gone:
+                changed |= {p for p in state if not gone.isdisjoint(p.parents)}
+            paths = sorted(
+                p for p in changed
+                if p.suffix.lower() in EXTENSION_MAP
+                and not in_skipped_dir(p, directory)
+            )
+            if not paths:
+                continue
+            rescan(paths)
+            emit("scan_complete", files=len(paths))
+            out.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+# ============================================================================
+# Git Scope
+# ============================================================================
+
+# New-file side of a unified diff hunk header: "@@ -a,b +start,count @@"
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# Changed files mapped to their changed line ranges; None = the whole file
+ChangedLines = Dict[Path, Optional[List[Tuple[int, int]]]]
+
+
+def git_changed_lines(path: Path, since: Optional[str] = None, staged: bool = False) -> ChangedLines:
+    """Ask git which files under path changed, and which of their lines.
+
+    Kept identical in security_audit.py and sql_analyzer.py, which are both
+    standalone scripts.
+
+    With since, the working tree is compared with that revision and
+    untracked files count as entirely changed; with staged, the index is
+    compared with HEAD. Deleted files are left out. Paths are returned the
+    way a directory walk from path would spell them.
+    """
+    cwd = path if path.is_dir() else path.parent
+
+    def git(*args: str) -> str:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            cwd=cwd, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+        return result.stdout
+
+    top = Path(git("rev-parse", "--show-toplevel").strip())
+    pathspec = str(path.resolve())
+
+    def local(name: str) -> Path:
+        absolute = top / name
+        return absolute if path.is_absolute() else Path(os.path.relpath(absolute))
+
+    diff = git(
+        "diff", "--unified=0", "--no-color", "--no-ext-diff", "--diff-filter=ACMR",
+        "--cached" if staged else since, "--", pathspec,
+    )
+
+    changed: ChangedLines = {}
+    current = None
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            name = line[4:]
+            current = None if name == "/dev/null" else local(name[2:])
+            if current is not None:
+                changed.setdefault(current, [])
+        elif current is not None and line.startswith("@@"):
+            match = HUNK_HEADER.match(line)
+            if match:
+                start = int(match.group(1))
+                count = int(match.group(2) or 1)
+                if count:
+                    changed[current].append((start, start + count - 1))
+
+    if not staged:
+        untracked = git("ls-files", "--others", "--exclude-standard", "--full-name", "--", pathspec)
+        for name in untracked.splitlines():
+            changed[local(name)] = None
+
+    return changed
+
+
+def in_changed_lines(file: str, line: Optional[int], changed: ChangedLines) -> bool:
+    """Whether a reported line falls on a changed line of a changed file."""
+    ranges = changed.get(Path(file), [])
+    if ranges is None:
+        return True
+    return line is not None and any(start <= line <= end for start, end in ranges)
+
+
 # ============================================================================
 # Main
 # ============================================================================
@@ -571,39 +1431,175 @@ def main():
     )
     parser.add_argument(
         "--format",
-        choices=["text", "json", "sarif"],
+        choices=["text", "json", "sarif", "ndjson"],
         default="text",
-        help="Output format (default: text)",
+        help="Output format; ndjson is always streamed (default: text)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write SARIF results as files are scanned, in scan order instead of by severity",
+    )
+    parser.add_argument(
+        "--output", "-o",
+        type=Path,
+        help="Write the report to this file instead of stdout",
     )
     parser.add_argument(
         "--exit-code",
         action="store_true",
         help="Exit with non-zero code if issues found",
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes, 0 = all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        help="Cache file for incremental scans of unchanged files",
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=50000,
+        help="Maximum number of cached files (default: 50000)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and emit added/resolved findings as JSON lines on change",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between scans when inotify is unavailable (default: 1.0)",
+    )
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument(
+        "--since",
+        metavar="REV",
+        help="Only scan files changed since a git revision (plus untracked files)",
+    )
+    scope.add_argument(
+        "--staged",
+        action="store_true",
+        help="Only scan files with changes staged in git",
+    )
+    parser.add_argument(
+        "--changed-lines",
+        action="store_true",
+        help="With --since/--staged, only report findings on changed lines",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["text", "json"],
+        help="Time every rule and print the hottest ones to stderr in this format",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of rules in the profile, 0 = all (default: 20)",
+    )
 
     args = parser.parse_args()
 
+    if args.stream and args.format not in ("sarif", "ndjson"):
+        parser.error("--stream requires --format sarif or ndjson")
+    if args.changed_lines and not (args.since or args.staged):
+        parser.error("--changed-lines requires --since or --staged")
+
     if not args.directory.exists():
         print(f"Error: Directory not found: {args.directory}", file=sys.stderr)
         sys.exit(1)
 
     min_severity = Severity(args.severity)
     scanner = SecurityScanner(min_severity=min_severity)
-    findings = scanner.scan_directory(args.directory)
+    if args.profile:
+        # Timings are collected in-process and every file has to be scanned,
+        # so profiling runs serially and bypasses the cache
+        scanner.profile = RuleProfile()
+        args.jobs = 1
+        args.cache = None
+    if args.cache:
+        scanner.cache = FindingsCache(
+            args.cache, scanner.fingerprint(), args.cache_max_entries
+        )
+        scanner.cache.load()
+
+    if args.watch:
+        try:
+            watch_directory(scanner, args.directory, poll_interval=args.poll_interval)
+        finally:
+            if scanner.cache is not None:
+                scanner.cache.save()
+        return
+
+    changed = None
+    if args.since or args.staged:
+        try:
+            changed = git_changed_lines(args.directory, args.since, args.staged)
+        except (OSError, RuntimeError) as e:
+            print(f"Error: git: {e}", file=sys.stderr)
+            sys.exit(1)
 
-    if args.format == "json":
-        print(report_json(findings))
-    elif args.format == "sarif":
-        print(report_sarif(findings))
-    else:
-        print(report_text(findings))
+    def in_scope(findings: List[Finding]) -> List[Finding]:
+        if not args.changed_lines:
+            return findings
+        return [f for f in findings if in_changed_lines(f.file, f.line, changed)]
+
+    paths = sorted(changed) if changed is not None else None
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    try:
+        if args.format == "ndjson" or args.stream:
+            writer = (
+                NdjsonWriter(out) if args.format == "ndjson"
+                else SarifWriter(out, scanner.reportable_rules())
+            )
+            # Only the exit-code tally is kept in memory
+            found = critical_high = 0
+            for file_findings in scanner.iter_findings(args.directory, jobs, paths):
+                file_findings = in_scope(file_findings)
+                writer.write(file_findings)
+                found += len(file_findings)
+                critical_high += sum(
+                    1 for f in file_findings
+                    if f.severity in [Severity.CRITICAL, Severity.HIGH]
+                )
+            writer.close()
+        else:
+            findings = in_scope(scanner.scan_directory(args.directory, jobs, paths))
+            found = len(findings)
+            critical_high = sum(
+                1 for f in findings
+                if f.severity in [Severity.CRITICAL, Severity.HIGH]
+            )
+
+            if args.format == "json":
+                print(report_json(findings), file=out)
+            elif args.format == "sarif":
+                print(report_sarif(findings), file=out)
+            else:
+                print(report_text(findings), file=out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
 
-    if args.exit_code and findings:
+    if scanner.cache is not None:
+        scanner.cache.save()
+
+    if scanner.profile is not None:
+        report = scanner.profile.report_json if args.profile == "json" else scanner.profile.report_text
+        print(report(args.profile_top), file=sys.stderr)
+
+    if args.exit_code and found:
         # Exit with number of critical/high issues (max 125)
-        critical_high = sum(
-            1 for f in findings
-            if f.severity in [Severity.CRITICAL, Severity.HIGH]
-        )
         sys.exit(min(critical_high, 125) or 1)
 
 
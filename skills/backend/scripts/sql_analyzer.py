@@ -12,17 +12,30 @@ Examples:
     python sql_analyzer.py ./migrations
     python sql_analyzer.py query.sql --format json
     python sql_analyzer.py ./src --pattern "*.sql"
+    python sql_analyzer.py dump.sql --stream
+    python sql_analyzer.py mysqldump.sql --stream --dialect mysql
+    python sql_analyzer.py ./migrations --profile text
+    python sql_analyzer.py dump.sql --rule-budget 2
+    python sql_analyzer.py ./migrations --since origin/main --changed-lines
 """
 
 import argparse
+import bisect
+import hashlib
+import io
 import json
 import os
 import re
+import signal
+import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Set, Tuple
+from typing import Iterator, List, Optional, Dict, Pattern, Set, TextIO, Tuple
 
 
 class IssueType(Enum):
@@ -61,6 +74,19 @@ class IndexSuggestion:
     impact: str
 
 
+# Vendored and VCS directories skipped under a scanned directory
+SKIP_DIRS = {"node_modules", "vendor", ".git", "__pycache__"}
+
+
+def in_skipped_dir(path: Path, root: Path) -> bool:
+    """Whether a path lies in one of SKIP_DIRS below root (root itself may be anywhere)."""
+    try:
+        parts = path.relative_to(root).parts[:-1]
+    except ValueError:
+        return False
+    return not SKIP_DIRS.isdisjoint(parts)
+
+
 # ============================================================================
 # SQL Patterns
 # ============================================================================
@@ -252,35 +278,502 @@ SQL_PATTERNS = [
 ]
 
 
+# ============================================================================
+# Statements
+# ============================================================================
+
+class LineIndex:
+    """Maps character offsets in a text to 1-based line numbers.
+
+    Newline offsets are collected once, so each lookup is a binary search
+    instead of rescanning the prefix of the text.
+    """
+
+    def __init__(self, content: str):
+        self.newlines = [m.start() for m in re.finditer("\n", content)]
+
+    def line_of(self, offset: int) -> int:
+        """Return the line number containing the given offset."""
+        return bisect.bisect_left(self.newlines, offset) + 1
+
+
+class StatementSplitter:
+    """Incrementally splits SQL text into statements.
+
+    Semicolons inside quoted strings, identifiers, dollar-quoted bodies and
+    comments do not end a statement. Data blocks following
+    ``COPY ... FROM stdin;`` are skipped up to their ``\\.`` terminator.
+    Only the statement currently being read is buffered.
+
+    Backslash escapes a quote only inside E'...' strings, as in standard SQL
+    and PostgreSQL; with backslash_escapes (MySQL) it does so in every
+    single-quoted string.
+    """
+
+    _TOKEN = re.compile(r"[;'\"`$]|--|/\*")
+    _DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z_0-9]*)?\$")
+    _PARTIAL_DOLLAR_TAG = re.compile(r"\$(?:[A-Za-z_][A-Za-z_0-9]*)?")
+    _COPY_FROM_STDIN = re.compile(r"\bCOPY\b[^;]*\bFROM\s+STDIN\b[^;]*;$", re.IGNORECASE)
+    _COPY_END = re.compile(r"^\\\.(?:\n|$)", re.MULTILINE)
+    _SINGLE_QUOTE_END = re.compile(r"['\\]")
+
+    def __init__(self, backslash_escapes: bool = False):
+        self.backslash_escapes = backslash_escapes
+        self.buf = ""
+        self.pos = 0
+        self.line = 1  # line number of buf[0]
+        self.state = "normal"
+        self.closing = ""  # quote character or dollar tag that ends the state
+        self.escapes = False  # whether backslash escapes in the current string
+
+    def feed(self, chunk: str) -> List[Tuple[int, str]]:
+        """Consume a chunk and return the (start line, text) of completed statements."""
+        self.buf += chunk
+        statements = []
+
+        while True:
+            if self.state == "normal":
+                match = self._TOKEN.search(self.buf, self.pos)
+                if match is None:
+                    # Keep the last character: it may start "--" or "/*"
+                    self.pos = max(self.pos, len(self.buf) - 1)
+                    break
+
+                token = match.group()
+                if token == ";":
+                    statement = self._take(match.end())
+                    if statement:
+                        statements.append(statement)
+                        if self._COPY_FROM_STDIN.search(statement[1]):
+                            self.state = "copy"
+                elif token == "$":
+                    if not self._enter_dollar_quote(match.start()):
+                        break
+                else:
+                    self.state = {"--": "line_comment", "/*": "block_comment"}.get(token, "quoted")
+                    self.closing = {"--": "\n", "/*": "*/"}.get(token, token)
+                    self.escapes = token == "'" and self._escape_string(match.start())
+                    self.pos = match.end()
+
+            elif self.state == "quoted" and self.escapes:
+                match = self._SINGLE_QUOTE_END.search(self.buf, self.pos)
+                if match is None:
+                    self.pos = len(self.buf)
+                    break
+                if match.group() == "\\":
+                    # Backslash escape; wait for the escaped char
+                    if match.end() >= len(self.buf):
+                        self.pos = match.start()
+                        break
+                    self.pos = match.end() + 1
+                else:
+                    self.state = "normal"
+                    self.pos = match.end()
+
+            elif self.state == "copy":
+                match = self._COPY_END.search(self.buf, self.pos)
+                if match is None or not match.group().endswith("\n"):
+                    # Drop complete data lines, keeping a partial last line
+                    cut = self.buf.rfind("\n") + 1
+                    self._skip(cut)
+                    break
+                self._skip(match.end())
+                self.state = "normal"
+
+            else:
+                # Double quotes, backticks, comments and dollar-quoted bodies
+                end = self.buf.find(self.closing, self.pos)
+                if end == -1:
+                    self.pos = max(self.pos, len(self.buf) - len(self.closing) + 1)
+                    break
+                self.state = "normal"
+                self.pos = end + len(self.closing)
+
+        return statements
+
+    def close(self) -> Optional[Tuple[int, str]]:
+        """Return the trailing statement without a terminating semicolon."""
+        if self.state == "copy":
+            return None
+        return self._take(len(self.buf))
+
+    def _escape_string(self, start: int) -> bool:
+        """Whether the string opened by the quote at start takes backslash escapes."""
+        if self.backslash_escapes:
+            return True
+        # E'...' prefix, not the end of an identifier such as name'...'
+        return (
+            start > 0 and self.buf[start - 1] in "eE"
+            and not (start > 1 and (self.buf[start - 2].isalnum() or self.buf[start - 2] == "_"))
+        )
+
+    def _enter_dollar_quote(self, start: int) -> bool:
+        """Handle a "$" token; return False if more input is needed."""
+        # "$" inside an identifier (e.g. a$b) does not start a dollar quote
+        if start > 0 and (self.buf[start - 1].isalnum() or self.buf[start - 1] == "_"):
+            self.pos = start + 1
+            return True
+
+        tag = self._DOLLAR_TAG.match(self.buf, start)
+        if tag:
+            self.state = "dollar"
+            self.closing = tag.group()
+            self.pos = tag.end()
+            return True
+
+        if self._PARTIAL_DOLLAR_TAG.fullmatch(self.buf, start):
+            self.pos = start
+            return False
+
+        # Positional parameter ($1) or a lone "$"
+        self.pos = start + 1
+        return True
+
+    def _take(self, end: int) -> Optional[Tuple[int, str]]:
+        """Remove buf[:end] and return it as a statement, if not blank."""
+        text = self.buf[:end]
+        self._skip(end)
+
+        stripped = text.lstrip()
+        if not stripped:
+            return None
+        start_line = self.line - text.count("\n") + text.count("\n", 0, len(text) - len(stripped))
+        return start_line, stripped.rstrip()
+
+    def _skip(self, end: int) -> None:
+        """Discard buf[:end], keeping the line count in sync."""
+        self.line += self.buf.count("\n", 0, end)
+        self.buf = self.buf[end:]
+        self.pos = 0
+
+
+def iter_statements(
+    stream: TextIO, chunk_size: int = 1 << 20, backslash_escapes: bool = False
+) -> Iterator[Tuple[int, str]]:
+    """Yield (start line, text) for each statement read from a text stream."""
+    splitter = StatementSplitter(backslash_escapes)
+
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        yield from splitter.feed(chunk)
+
+    tail = splitter.close()
+    if tail:
+        yield tail
+
+
+def _file_digest(file_path: Path) -> str:
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# ============================================================================
+# Rule Profiling
+# ============================================================================
+
+# Each script is standalone, so this class is copied verbatim into
+# security_audit.py, sql_analyzer.py and performance_audit.py: keep the
+# copies identical.
+
+class RuleProfile:
+    """Time spent, lines evaluated and matches per rule across a scan."""
+
+    def __init__(self):
+        # (table, rule) -> [seconds, lines evaluated, matches]
+        self.stats: Dict[Tuple[str, str], list] = {}
+
+    def record(self, table: str, rule: str, seconds: float, evaluated: int, matches: int) -> None:
+        """Add one measurement for a rule."""
+        entry = self.stats.setdefault((table, rule), [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += evaluated
+        entry[2] += matches
+
+    def top(self, limit: Optional[int] = None) -> List[dict]:
+        """Rules ordered by total time, most expensive first."""
+        rows = [
+            {
+                "table": table,
+                "rule": rule,
+                "seconds": round(seconds, 6),
+                "evaluated": evaluated,
+                "matches": matches,
+                "us_per_line": round(seconds / evaluated * 1e6, 3) if evaluated else 0.0,
+            }
+            for (table, rule), (seconds, evaluated, matches) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def report_text(self, limit: Optional[int] = None) -> str:
+        """Format the hottest rules as a table."""
+        lines = [
+            "=" * 90,
+            "RULE PROFILE",
+            "=" * 90,
+            f"{'ms':>9} {'us/line':>8} {'lines':>9} {'matches':>8}  rule",
+            "-" * 90,
+        ]
+        for row in self.top(limit):
+            lines.append(
+                f"{row['seconds'] * 1000:9.2f} {row['us_per_line']:8.2f} "
+                f"{row['evaluated']:9d} {row['matches']:8d}  {row['table']}: {row['rule']}"
+            )
+        lines.append("=" * 90)
+        return "\n".join(lines)
+
+    def report_json(self, limit: Optional[int] = None) -> str:
+        """Format the hottest rules as JSON."""
+        return json.dumps({"rules": self.top(limit)}, indent=2)
+
+
 # ============================================================================
 # Analyzer
 # ============================================================================
 
+class RuleTimeout(Exception):
+    """A rule ran past the remainder of its time budget."""
+
+
+class RuleBudget:
+    """Total time each rule may spend on one file.
+
+    On the main thread of a Unix process a running match is interrupted
+    with SIGALRM once the rule's budget is used up (the regex engine checks
+    for signals while backtracking). Elsewhere the rule is only stopped
+    after the call that exhausted its budget returns.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.spent: Dict[str, float] = {}
+        # rule -> (start line of the statement where it ran out, seconds spent)
+        self.exceeded: Dict[str, Tuple[int, float]] = {}
+        self.line = 1
+        self._armed = False
+        self._previous_handler = None
+
+    def __enter__(self) -> "RuleBudget":
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._expired)
+            self._armed = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+            self._armed = False
+
+    @staticmethod
+    def _expired(signum, frame):
+        raise RuleTimeout()
+
+    def run(self, rule: str, func) -> bool:
+        """Call func under the rule's remaining budget.
+
+        Returns False if the rule had already used up its budget or was
+        interrupted; it is then skipped for the rest of the file. Callers
+        keep ``line`` pointing at the statement being matched so the
+        report can say where the rule stopped.
+        """
+        if rule in self.exceeded:
+            return False
+
+        spent = self.spent.get(rule, 0.0)
+        completed = True
+        start = time.perf_counter()
+        try:
+            try:
+                if self._armed:
+                    signal.setitimer(signal.ITIMER_REAL, max(self.seconds - spent, 1e-3))
+                func()
+            finally:
+                if self._armed:
+                    signal.setitimer(signal.ITIMER_REAL, 0)
+        except RuleTimeout:
+            completed = False
+
+        spent += time.perf_counter() - start
+        self.spent[rule] = spent
+        if not completed or spent >= self.seconds:
+            self.exceeded[rule] = (self.line, spent)
+        return completed
+
+
+# (line offset, text) of one statement
+StatementWindow = Tuple[int, str]
+
+
 class SQLAnalyzer:
     """Analyzes SQL for issues and optimization opportunities."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        profile: Optional[RuleProfile] = None,
+        rule_budget: Optional[float] = 5.0,
+        dialect: str = "postgresql",
+    ):
+        self.profile = profile
+        self.rule_budget = rule_budget
+        # MySQL treats backslash as an escape in every string literal
+        self.backslash_escapes = dialect == "mysql"
         self.compiled_patterns = [
             (re.compile(p["pattern"], re.IGNORECASE | re.MULTILINE), p)
             for p in SQL_PATTERNS
         ]
+        # Find WHERE/JOIN clauses and suggest indexes
+        self.where_pattern = re.compile(
+            r"(?:WHERE|JOIN.*ON)\s+(\w+)\.(\w+)\s*[=<>]",
+            re.IGNORECASE
+        )
 
-    def analyze_file(self, file_path: Path) -> List[Issue]:
-        """Analyze a single SQL file."""
-        issues = []
+    def analyze_file(self, file_path: Path, streaming: bool = False) -> List[Issue]:
+        """Analyze a single SQL file.
+
+        Patterns are matched one statement at a time, so no match can span
+        statements and a rule's worst case is bounded by the longest one.
+        """
+        if streaming:
+            return self.analyze_file_streaming(file_path)
 
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
         except Exception:
-            return issues
+            return []
+
+        windows = [
+            (start_line - 1, statement)
+            for start_line, statement in iter_statements(
+                io.StringIO(content), backslash_escapes=self.backslash_escapes
+            )
+        ]
+
+        with self._budget() as budget:
+            issues = self._match_patterns(file_path, windows, budget)
+
+            # Additional analysis
+            issues.extend(self._analyze_missing_indexes(file_path, windows, budget, set()))
+
+        return issues + self._budget_issues(file_path, budget)
+
+    def analyze_file_streaming(self, file_path: Path, chunk_size: int = 1 << 20) -> List[Issue]:
+        """Analyze a SQL file in batches of statements with bounded memory.
+
+        The file is read in chunks and split into statements; roughly
+        chunk_size characters of statements are held in memory at a time.
+        """
+        issues = []
+        index_issues = []
+        suggested: Set[Tuple[str, str]] = set()
+
+        def flush(batch: List[StatementWindow]) -> None:
+            issues.extend(self._match_patterns(file_path, batch, budget))
+            index_issues.extend(self._analyze_missing_indexes(file_path, batch, budget, suggested))
+            batch.clear()
+
+        with self._budget() as budget:
+            batch: List[StatementWindow] = []
+            batch_size = 0
+            try:
+                with open(file_path, encoding="utf-8", errors="ignore") as stream:
+                    for start_line, statement in iter_statements(
+                        stream, chunk_size, self.backslash_escapes
+                    ):
+                        batch.append((start_line - 1, statement))
+                        batch_size += len(statement)
+                        if batch_size >= chunk_size:
+                            flush(batch)
+                            batch_size = 0
+            except (IOError, OSError):
+                return issues
+            flush(batch)
+
+        return issues + index_issues + self._budget_issues(file_path, budget)
+
+    def _budget(self) -> RuleBudget:
+        """Fresh per-file rule budget; unlimited when rule_budget is unset."""
+        return RuleBudget(self.rule_budget or float("inf"))
+
+    def _find(
+        self,
+        table: str,
+        rule: str,
+        regex: Pattern,
+        windows: List[StatementWindow],
+        budget: RuleBudget,
+    ) -> List[Tuple[int, re.Match]]:
+        """Match a rule in each statement in turn, within its time budget.
+
+        Returns (window index, match) pairs; matches found before the
+        budget ran out are kept.
+        """
+        found = []
+        search = regex.search
+
+        def scan():
+            index = -1
+            try:
+                for index, (_, text) in enumerate(windows):
+                    # Most statements match no rule; search is cheaper than
+                    # setting up finditer for them
+                    if search(text):
+                        found.extend((index, match) for match in regex.finditer(text))
+            finally:
+                if index >= 0:
+                    budget.line = windows[index][0] + 1
+
+        start = time.perf_counter()
+        budget.run(rule, scan)
+        if self.profile is not None:
+            self.profile.record(
+                table, rule, time.perf_counter() - start,
+                sum(text.count("\n") + 1 for _, text in windows), len(found),
+            )
+        return found
+
+    @staticmethod
+    def _locate(
+        windows: List[StatementWindow],
+        index: int,
+        offset: int,
+        located: Dict[int, Tuple[LineIndex, List[str]]],
+    ) -> Tuple[int, str]:
+        """File line number and line text of an offset in windows[index].
+
+        Line indexes are built on first use, since most statements never
+        match, and kept in located for later matches in the same statement.
+        """
+        if index not in located:
+            text = windows[index][1]
+            located[index] = (LineIndex(text), text.split("\n"))
+        line_index, lines = located[index]
+        line_num = line_index.line_of(offset)
+        line = lines[line_num - 1] if line_num <= len(lines) else ""
+        return windows[index][0] + line_num, line
+
+    def _match_patterns(
+        self,
+        file_path: Path,
+        windows: List[StatementWindow],
+        budget: RuleBudget,
+    ) -> List[Issue]:
+        """Run SQL_PATTERNS over each statement, rule by rule."""
+        issues = []
 
-        lines = content.split("\n")
+        located: Dict[int, Tuple[LineIndex, List[str]]] = {}
 
         for regex, pattern_def in self.compiled_patterns:
-            for match in regex.finditer(content):
-                # Calculate line number
-                line_num = content[:match.start()].count("\n") + 1
-                snippet = lines[line_num - 1].strip()[:100] if line_num <= len(lines) else ""
+            found = self._find("SQL_PATTERNS", pattern_def["title"], regex, windows, budget)
+
+            for index, match in found:
+                line_num, line = self._locate(windows, index, match.start(), located)
 
                 issues.append(Issue(
                     file=str(file_path),
@@ -290,34 +783,38 @@ class SQLAnalyzer:
                     title=pattern_def["title"],
                     description=pattern_def["description"],
                     suggestion=pattern_def["suggestion"],
-                    sql_snippet=snippet,
+                    sql_snippet=line.strip()[:100],
                 ))
 
-        # Additional analysis
-        issues.extend(self._analyze_missing_indexes(file_path, content))
-
         return issues
 
-    def _analyze_missing_indexes(self, file_path: Path, content: str) -> List[Issue]:
-        """Analyze for potentially missing indexes."""
+    def _analyze_missing_indexes(
+        self,
+        file_path: Path,
+        windows: List[StatementWindow],
+        budget: RuleBudget,
+        suggested: Set[Tuple[str, str]],
+    ) -> List[Issue]:
+        """Analyze for potentially missing indexes.
+
+        suggested tracks (table, column) pairs already reported so each is
+        suggested once per file.
+        """
         issues = []
 
-        # Find WHERE/JOIN clauses and suggest indexes
-        where_pattern = re.compile(
-            r"(?:WHERE|JOIN.*ON)\s+(\w+)\.(\w+)\s*[=<>]",
-            re.IGNORECASE
+        found = self._find(
+            "SQLAnalyzer", "<index candidates>", self.where_pattern, windows, budget
         )
 
-        # Track suggested indexes to avoid duplicates
-        suggested: Set[Tuple[str, str]] = set()
+        located: Dict[int, Tuple[LineIndex, List[str]]] = {}
 
-        for match in where_pattern.finditer(content):
+        for index, match in found:
             table, column = match.groups()
             key = (table.lower(), column.lower())
 
             if key not in suggested:
                 suggested.add(key)
-                line_num = content[:match.start()].count("\n") + 1
+                line_num, _ = self._locate(windows, index, match.start(), located)
 
                 issues.append(Issue(
                     file=str(file_path),
@@ -332,16 +829,83 @@ class SQLAnalyzer:
 
         return issues
 
-    def analyze_directory(self, directory: Path, pattern: str = "*.sql") -> List[Issue]:
-        """Analyze all SQL files in a directory."""
-        issues = []
+    def _budget_issues(self, file_path: Path, budget: RuleBudget) -> List[Issue]:
+        """Report every rule that was stopped for exceeding its budget."""
+        return [
+            Issue(
+                file=str(file_path),
+                line=line,
+                issue_type=IssueType.BEST_PRACTICE,
+                severity=Severity.INFO,
+                title=f"Rule time budget exceeded: {rule}",
+                description=(
+                    f"Rule ran for {spent:.2f}s against a {budget.seconds:g}s budget "
+                    f"and was skipped from the statement on this line onwards"
+                ),
+                suggestion="Split very long statements or raise --rule-budget",
+                sql_snippet=None,
+            )
+            for rule, (line, spent) in budget.exceeded.items()
+        ]
 
+    def iter_files(self, directory: Path, pattern: str = "*.sql") -> Iterator[Path]:
+        """Yield SQL files in a directory, skipping vendored and VCS paths."""
         for sql_file in directory.rglob(pattern):
-            if any(skip in str(sql_file) for skip in [
-                "node_modules", "vendor", ".git", "__pycache__"
-            ]):
-                continue
-            issues.extend(self.analyze_file(sql_file))
+            if not in_skipped_dir(sql_file, directory):
+                yield sql_file
+
+    def analyze_directory(
+        self,
+        directory: Path,
+        pattern: str = "*.sql",
+        streaming: bool = False,
+        paths: Optional[List[Path]] = None,
+    ) -> List[Issue]:
+        """Analyze all SQL files in a directory.
+
+        If paths is given, only those of them matching pattern are analyzed
+        instead of searching the directory. Byte-identical files are
+        analyzed once and their issues reported for every copy.
+        """
+        issues = []
+
+        if paths is None:
+            files = list(self.iter_files(directory, pattern))
+        else:
+            files = [
+                sql_file for sql_file in paths
+                if sql_file.match(pattern) and not in_skipped_dir(sql_file, directory)
+            ]
+
+        # Only files whose size is shared with another file can be copies, so
+        # only those are hashed; every other file keeps a key of its own
+        sizes: List[Optional[int]] = []
+        for sql_file in files:
+            try:
+                sizes.append(sql_file.stat().st_size)
+            except OSError:
+                sizes.append(None)
+        counts = Counter(sizes)
+
+        copies: Dict[str, List[Path]] = {}
+        for sql_file, size in zip(files, sizes):
+            key = f"path:{sql_file}"
+            if size is not None and counts[size] > 1:
+                try:
+                    key = _file_digest(sql_file)
+                except OSError:
+                    pass
+            copies.setdefault(key, []).append(sql_file)
+
+        by_file: Dict[Path, List[Issue]] = {}
+        for paths in copies.values():
+            file_issues = self.analyze_file(paths[0], streaming=streaming)
+            by_file[paths[0]] = file_issues
+            for copy_path in paths[1:]:
+                by_file[copy_path] = [replace(i, file=str(copy_path)) for i in file_issues]
+
+        for sql_file in files:
+            issues.extend(by_file[sql_file])
 
         # Sort by severity
         severity_order = [Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]
@@ -376,6 +940,83 @@ class SQLAnalyzer:
         return suggestions
 
 
+# ============================================================================
+# Git Scope
+# ============================================================================
+
+# New-file side of a unified diff hunk header: "@@ -a,b +start,count @@"
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+# Changed files mapped to their changed line ranges; None = the whole file
+ChangedLines = Dict[Path, Optional[List[Tuple[int, int]]]]
+
+
+def git_changed_lines(path: Path, since: Optional[str] = None, staged: bool = False) -> ChangedLines:
+    """Ask git which files under path changed, and which of their lines.
+
+    Kept identical in security_audit.py and sql_analyzer.py, which are both
+    standalone scripts.
+
+    With since, the working tree is compared with that revision and
+    untracked files count as entirely changed; with staged, the index is
+    compared with HEAD. Deleted files are left out. Paths are returned the
+    way a directory walk from path would spell them.
+    """
+    cwd = path if path.is_dir() else path.parent
+
+    def git(*args: str) -> str:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            cwd=cwd, capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+        return result.stdout
+
+    top = Path(git("rev-parse", "--show-toplevel").strip())
+    pathspec = str(path.resolve())
+
+    def local(name: str) -> Path:
+        absolute = top / name
+        return absolute if path.is_absolute() else Path(os.path.relpath(absolute))
+
+    diff = git(
+        "diff", "--unified=0", "--no-color", "--no-ext-diff", "--diff-filter=ACMR",
+        "--cached" if staged else since, "--", pathspec,
+    )
+
+    changed: ChangedLines = {}
+    current = None
+    for line in diff.splitlines():
+        if line.startswith("+++ "):
+            name = line[4:]
+            current = None if name == "/dev/null" else local(name[2:])
+            if current is not None:
+                changed.setdefault(current, [])
+        elif current is not None and line.startswith("@@"):
+            match = HUNK_HEADER.match(line)
+            if match:
+                start = int(match.group(1))
+                count = int(match.group(2) or 1)
+                if count:
+                    changed[current].append((start, start + count - 1))
+
+    if not staged:
+        untracked = git("ls-files", "--others", "--exclude-standard", "--full-name", "--", pathspec)
+        for name in untracked.splitlines():
+            changed[local(name)] = None
+
+    return changed
+
+
+def in_changed_lines(file: str, line: Optional[int], changed: ChangedLines) -> bool:
+    """Whether a reported line falls on a changed line of a changed file."""
+    ranges = changed.get(Path(file), [])
+    if ranges is None:
+        return True
+    return line is not None and any(start <= line <= end for start, end in ranges)
+
+
 # ============================================================================
 # Reporters
 # ============================================================================
@@ -546,19 +1187,87 @@ def main():
         action="store_true",
         help="Exit with non-zero code if issues found",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read files in chunks and analyze statement by statement (for large dumps)",
+    )
+    parser.add_argument(
+        "--dialect",
+        choices=["postgresql", "mysql", "sqlite"],
+        default="postgresql",
+        help="SQL dialect; mysql treats backslash as an escape in all strings (default: postgresql)",
+    )
+    parser.add_argument(
+        "--rule-budget",
+        type=float,
+        default=5.0,
+        help="Seconds each rule may spend per file before it is skipped, 0 = unlimited (default: 5)",
+    )
+    scope = parser.add_mutually_exclusive_group()
+    scope.add_argument(
+        "--since",
+        metavar="REV",
+        help="Only analyze files changed since a git revision (plus untracked files)",
+    )
+    scope.add_argument(
+        "--staged",
+        action="store_true",
+        help="Only analyze files with changes staged in git",
+    )
+    parser.add_argument(
+        "--changed-lines",
+        action="store_true",
+        help="With --since/--staged, only report issues on changed lines",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["text", "json"],
+        help="Time every rule and print the hottest ones to stderr in this format",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of rules in the profile, 0 = all (default: 20)",
+    )
 
     args = parser.parse_args()
 
+    if args.changed_lines and not (args.since or args.staged):
+        parser.error("--changed-lines requires --since or --staged")
+
     if not args.path.exists():
         print(f"Error: Path not found: {args.path}", file=sys.stderr)
         sys.exit(1)
 
-    analyzer = SQLAnalyzer()
+    analyzer = SQLAnalyzer(
+        profile=RuleProfile() if args.profile else None,
+        rule_budget=args.rule_budget or None,
+        dialect=args.dialect,
+    )
+
+    if args.since or args.staged:
+        try:
+            changed = git_changed_lines(args.path, args.since, args.staged)
+        except (OSError, RuntimeError) as e:
+            print(f"Error: git: {e}", file=sys.stderr)
+            sys.exit(1)
 
-    if args.path.is_file():
-        issues = analyzer.analyze_file(args.path)
+        issues = analyzer.analyze_directory(
+            args.path, args.pattern, streaming=args.stream, paths=sorted(changed)
+        )
+        if args.changed_lines:
+            issues = [i for i in issues if in_changed_lines(i.file, i.line, changed)]
+    elif args.path.is_file():
+        issues = analyzer.analyze_file(args.path, streaming=args.stream)
     else:
-        issues = analyzer.analyze_directory(args.path, args.pattern)
+        issues = analyzer.analyze_directory(args.path, args.pattern, streaming=args.stream)
+
+    if analyzer.profile is not None:
+        profile = analyzer.profile
+        report = profile.report_json if args.profile == "json" else profile.report_text
+        print(report(args.profile_top), file=sys.stderr)
 
     if args.format == "json":
         print(report_json(issues))
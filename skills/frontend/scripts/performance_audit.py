@@ -8,14 +8,20 @@ Usage:
     python performance_audit.py <file-or-directory>
     python performance_audit.py src/components/
     python performance_audit.py src/components/Button.tsx
+    python performance_audit.py src/ --ignore storybook-static
+    python performance_audit.py src/ --profile text --profile-top 10
 """
 
+import argparse
+import json
+import os
 import re
 import sys
+import time
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
 
 
 class Severity(Enum):
@@ -24,6 +30,10 @@ class Severity(Enum):
     LOW = "LOW"
 
 
+# Compiled rule: (regex, severity, message, suggestion)
+CompiledRule = Tuple[Pattern, Severity, str, str]
+
+
 @dataclass
 class Issue:
     severity: Severity
@@ -34,6 +44,66 @@ class Issue:
     suggestion: Optional[str] = None
 
 
+# ============================================================================
+# Rule Profiling
+# ============================================================================
+
+# Each script is standalone, so this class is copied verbatim into
+# security_audit.py, sql_analyzer.py and performance_audit.py: keep the
+# copies identical.
+
+class RuleProfile:
+    """Time spent, lines evaluated and matches per rule across a scan."""
+
+    def __init__(self):
+        # (table, rule) -> [seconds, lines evaluated, matches]
+        self.stats: Dict[Tuple[str, str], list] = {}
+
+    def record(self, table: str, rule: str, seconds: float, evaluated: int, matches: int) -> None:
+        """Add one measurement for a rule."""
+        entry = self.stats.setdefault((table, rule), [0.0, 0, 0])
+        entry[0] += seconds
+        entry[1] += evaluated
+        entry[2] += matches
+
+    def top(self, limit: Optional[int] = None) -> List[dict]:
+        """Rules ordered by total time, most expensive first."""
+        rows = [
+            {
+                "table": table,
+                "rule": rule,
+                "seconds": round(seconds, 6),
+                "evaluated": evaluated,
+                "matches": matches,
+                "us_per_line": round(seconds / evaluated * 1e6, 3) if evaluated else 0.0,
+            }
+            for (table, rule), (seconds, evaluated, matches) in self.stats.items()
+        ]
+        rows.sort(key=lambda row: row["seconds"], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def report_text(self, limit: Optional[int] = None) -> str:
+        """Format the hottest rules as a table."""
+        lines = [
+            "=" * 90,
+            "RULE PROFILE",
+            "=" * 90,
+            f"{'ms':>9} {'us/line':>8} {'lines':>9} {'matches':>8}  rule",
+            "-" * 90,
+        ]
+        for row in self.top(limit):
+            lines.append(
+                f"{row['seconds'] * 1000:9.2f} {row['us_per_line']:8.2f} "
+                f"{row['evaluated']:9d} {row['matches']:8d}  {row['table']}: {row['rule']}"
+            )
+        lines.append("=" * 90)
+        return "\n".join(lines)
+
+    def report_json(self, limit: Optional[int] = None) -> str:
+        """Format the hottest rules as JSON."""
+        return json.dumps({"rules": self.top(limit)}, indent=2)
+
+
 class PerformanceAuditor:
     """Analyzes frontend code for performance issues."""
 
@@ -158,8 +228,56 @@ class PerformanceAuditor:
         ),
     ]
 
-    def __init__(self):
+    # File types audited when scanning a directory
+    EXTENSIONS = (".tsx", ".jsx", ".ts", ".js", ".vue")
+
+    # Directories never descended into
+    IGNORED_DIRS = frozenset({
+        "node_modules", "dist", "build", ".next", ".nuxt", ".output",
+        "coverage", ".git", ".cache",
+    })
+
+    def __init__(
+        self,
+        ignored_dirs: Optional[Iterable[str]] = None,
+        profile: Optional[RuleProfile] = None,
+    ):
         self.issues: List[Issue] = []
+        self.profile = profile
+        self.ignored_dirs = (
+            frozenset(ignored_dirs) if ignored_dirs is not None else self.IGNORED_DIRS
+        )
+
+        # Compiled rule sets keyed by (is_react, is_vue)
+        self.rule_sets: Dict[Tuple[bool, bool], Tuple[Pattern, List[CompiledRule]]] = {}
+        for is_react in (False, True):
+            for is_vue in (False, True):
+                patterns = self.GENERAL_PATTERNS + self.IMAGE_PATTERNS
+                if is_react:
+                    patterns = patterns + self.REACT_PATTERNS
+                if is_vue:
+                    patterns = patterns + self.VUE_PATTERNS
+                self.rule_sets[(is_react, is_vue)] = self._compile_rules(patterns)
+
+        # Rule message -> name of the pattern table it comes from
+        self.rule_tables = {
+            message: table
+            for table in ("REACT_PATTERNS", "VUE_PATTERNS", "GENERAL_PATTERNS", "IMAGE_PATTERNS")
+            for _, _, message, _ in getattr(self, table)
+        }
+
+    @staticmethod
+    def _compile_rules(patterns: list) -> Tuple[Pattern, List[CompiledRule]]:
+        """Compile patterns plus one alternation used to skip clean lines."""
+        rules = [
+            (re.compile(pattern, re.IGNORECASE), severity, message, suggestion)
+            for pattern, severity, message, suggestion in patterns
+        ]
+        prefilter = re.compile(
+            "|".join(f"(?:{pattern})" for pattern, *_ in patterns),
+            re.IGNORECASE,
+        )
+        return prefilter, rules
 
     def audit_file(self, file_path: Path) -> List[Issue]:
         """Audit a single file for performance issues."""
@@ -175,26 +293,33 @@ class PerformanceAuditor:
             is_vue = suffix == ".vue"
 
             # Apply patterns based on file type
-            patterns = self.GENERAL_PATTERNS + self.IMAGE_PATTERNS
-
-            if is_react:
-                patterns += self.REACT_PATTERNS
-            if is_vue:
-                patterns += self.VUE_PATTERNS
-
-            for pattern, severity, message, suggestion in patterns:
+            prefilter, rules = self.rule_sets[(is_react, is_vue)]
+
+            if self.profile is not None:
+                hits = self._match_profiled(lines, prefilter, rules)
+            else:
+                # Scan each line once; only lines hitting the prefilter are
+                # checked rule by rule
+                hits = [[] for _ in rules]
                 for i, line in enumerate(lines, 1):
-                    if re.search(pattern, line, re.IGNORECASE):
-                        issues.append(
-                            Issue(
-                                severity=severity,
-                                category="Performance",
-                                message=message,
-                                file=str(file_path),
-                                line=i,
-                                suggestion=suggestion,
-                            )
+                    if not prefilter.search(line):
+                        continue
+                    for index, (regex, *_) in enumerate(rules):
+                        if regex.search(line):
+                            hits[index].append(i)
+
+            for (_, severity, message, suggestion), line_nums in zip(rules, hits):
+                for i in line_nums:
+                    issues.append(
+                        Issue(
+                            severity=severity,
+                            category="Performance",
+                            message=message,
+                            file=str(file_path),
+                            line=i,
+                            suggestion=suggestion,
                         )
+                    )
 
             # Check file size
             if len(content) > 500 * 80:  # ~500 lines
@@ -213,17 +338,41 @@ class PerformanceAuditor:
 
         return issues
 
+    def _match_profiled(
+        self, lines: List[str], prefilter: Pattern, rules: List[CompiledRule]
+    ) -> List[List[int]]:
+        """Run each rule over every line on its own and record its cost."""
+        clock = time.perf_counter
+
+        start = clock()
+        candidates = sum(1 for line in lines if prefilter.search(line))
+        self.profile.record("PerformanceAuditor", "<prefilter>", clock() - start, len(lines), candidates)
+
+        hits = []
+        for regex, _, message, _ in rules:
+            start = clock()
+            line_nums = [i for i, line in enumerate(lines, 1) if regex.search(line)]
+            self.profile.record(
+                self.rule_tables[message], message, clock() - start, len(lines), len(line_nums)
+            )
+            hits.append(line_nums)
+        return hits
+
+    def iter_files(self, dir_path: Path) -> Iterator[Path]:
+        """Yield auditable files, pruning ignored directories during the walk."""
+        for root, dirs, files in os.walk(dir_path):
+            dirs[:] = sorted(d for d in dirs if d not in self.ignored_dirs)
+
+            for name in sorted(files):
+                if os.path.splitext(name)[1].lower() in self.EXTENSIONS:
+                    yield Path(root) / name
+
     def audit_directory(self, dir_path: Path) -> List[Issue]:
         """Audit all frontend files in a directory."""
         issues = []
-        extensions = [".tsx", ".jsx", ".ts", ".js", ".vue"]
 
-        for ext in extensions:
-            for file_path in dir_path.rglob(f"*{ext}"):
-                # Skip node_modules and build directories
-                if "node_modules" in str(file_path) or "dist" in str(file_path):
-                    continue
-                issues.extend(self.audit_file(file_path))
+        for file_path in self.iter_files(dir_path):
+            issues.extend(self.audit_file(file_path))
 
         return issues
 
@@ -299,17 +448,47 @@ def format_report(issues: List[Issue]) -> str:
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python performance_audit.py <file-or-directory>")
-        print("Example: python performance_audit.py src/components/")
-        sys.exit(1)
-
-    target = sys.argv[1]
-    auditor = PerformanceAuditor()
-    issues = auditor.audit(target)
+    parser = argparse.ArgumentParser(
+        description="Analyze frontend components for common performance issues"
+    )
+    parser.add_argument(
+        "target",
+        help="File or directory to audit",
+    )
+    parser.add_argument(
+        "--ignore",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Directory name to skip, on top of the defaults (repeatable)",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=["text", "json"],
+        help="Time every rule and print the hottest ones to stderr in this format",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="Number of rules in the profile, 0 = all (default: 20)",
+    )
+
+    args = parser.parse_args()
+
+    auditor = PerformanceAuditor(
+        ignored_dirs=PerformanceAuditor.IGNORED_DIRS | set(args.ignore),
+        profile=RuleProfile() if args.profile else None,
+    )
+    issues = auditor.audit(args.target)
 
     print(format_report(issues))
 
+    if auditor.profile is not None:
+        profile = auditor.profile
+        report = profile.report_json if args.profile == "json" else profile.report_text
+        print(report(args.profile_top), file=sys.stderr)
+
     # Exit with error code if high-severity issues found
     high_issues = [i for i in issues if i.severity == Severity.HIGH]
     if high_issues:
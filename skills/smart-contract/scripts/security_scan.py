@@ -8,14 +8,22 @@ This is a lightweight scanner - for production audits, use Slither, Mythril, etc
 Usage:
     python security_scan.py <contract.sol>
     python security_scan.py <directory>
+    python security_scan.py <directory> --jobs 0 --format sarif --exit-code
 """
 
+import argparse
+import bisect
+import hashlib
+import json
+import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 
 class Severity(Enum):
@@ -34,233 +42,420 @@ class Finding:
     line: int
     code: str
     recommendation: str
+    file: Optional[str] = None
+
+
+@dataclass
+class Block:
+    """A brace-delimited (or single-statement loop) region of a contract."""
+    kind: str  # contract, function, loop, assembly or block
+    name: str
+    start: int  # offset of the header
+    end: int  # offset just past the closing brace or semicolon
+    children: List["Block"] = field(default_factory=list)
+    child_starts: List[int] = field(default_factory=list)  # for bisecting children
+
+
+class SourceUnit:
+    """A Solidity file tokenized once into a comment/string-free view and a block tree.
+
+    ``code`` has the same length and line layout as ``text``, but comments
+    and string literal contents are replaced by spaces, so checks never match
+    inside them.
+    """
+
+    _SKIPPABLE = re.compile(r'//|/\*|"|\'')
+    _STRUCTURE = re.compile(r"[{}();]")
+    _CONTRACT_HEADER = re.compile(r"\b(?:abstract\s+)?(contract|library|interface)\s+(\w+)")
+    _FUNCTION_HEADER = re.compile(r"\b(?:function\s+(\w+)|(constructor|fallback|receive)\b|modifier\s+(\w+))")
+    _LOOP_HEADER = re.compile(r"\b(?:for|while)\s*\(|^\s*do\s*$")
+    _ASSEMBLY_HEADER = re.compile(r"\bassembly\b")
+    # "{" opening call options (addr.call{value: x}) or a struct literal
+    _EXPRESSION_BRACE = re.compile(r"(?:\.\s*\w+|\bnew\s+[\w.]+)\s*$")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.lines = text.split('\n')
+        self.code = self._strip_comments_and_strings(text)
+        self.code_lines = self.code.split('\n')
+        self.line_starts = [0]
+        for line in self.lines[:-1]:
+            self.line_starts.append(self.line_starts[-1] + len(line) + 1)
+        self.blocks = self._build_tree()
+        self.block_starts = [b.start for b in self.blocks]
+        for block in self.iter_blocks():
+            block.child_starts = [c.start for c in block.children]
+
+    @classmethod
+    def _strip_comments_and_strings(cls, text: str) -> str:
+        """Blank out comments and string contents, preserving newlines."""
+        pieces = []
+        pos = 0
+
+        def blank(segment: str) -> str:
+            return re.sub(r'[^\n]', ' ', segment)
+
+        while True:
+            match = cls._SKIPPABLE.search(text, pos)
+            if match is None:
+                pieces.append(text[pos:])
+                break
+
+            start = match.start()
+            pieces.append(text[pos:start])
+            token = match.group()
+
+            if token == '//':
+                end = text.find('\n', start)
+                end = len(text) if end == -1 else end
+                pieces.append(blank(text[start:end]))
+            elif token == '/*':
+                end = text.find('*/', start + 2)
+                end = len(text) if end == -1 else end + 2
+                pieces.append(blank(text[start:end]))
+            else:
+                # String literal: keep the quotes, blank the contents
+                end = start + 1
+                while end < len(text) and text[end] not in (token, '\n'):
+                    end += 2 if text[end] == '\\' else 1
+                end = min(end, len(text))
+                pieces.append(token + blank(text[start + 1:end]))
+                if end < len(text) and text[end] == token:
+                    pieces.append(token)
+                    end += 1
+            pos = end
+
+        return ''.join(pieces)
+
+    def _build_tree(self) -> List[Block]:
+        """Match braces in the code view and classify each block by its header."""
+        roots: List[Block] = []
+        # None entries mark expression braces (call options, struct literals)
+        stack: List[Optional[Block]] = []
+        statement_start = 0
+        paren_depth = 0
+
+        def attach(block: Block) -> None:
+            parent = next((b for b in reversed(stack) if b is not None), None)
+            (parent.children if parent else roots).append(block)
+
+        for match in self._STRUCTURE.finditer(self.code):
+            token = match.group()
+            offset = match.start()
+
+            if token == '(':
+                paren_depth += 1
+            elif token == ')':
+                paren_depth = max(0, paren_depth - 1)
+            elif token == ';':
+                if paren_depth:
+                    continue  # for (init; cond; step)
+                header = self.code[statement_start:offset]
+                if self._LOOP_HEADER.search(header):
+                    # Loop whose body is a single statement
+                    attach(Block("loop", "", statement_start, offset + 1))
+                statement_start = offset + 1
+            elif token == '{':
+                header = self.code[statement_start:offset]
+                if paren_depth or self._EXPRESSION_BRACE.search(header):
+                    stack.append(None)
+                    continue
+                block = Block(*self._classify(header), statement_start, len(self.code))
+                attach(block)
+                stack.append(block)
+                statement_start = offset + 1
+            else:  # '}'
+                block = stack.pop() if stack else None
+                if block is None:
+                    continue
+                block.end = offset + 1
+                statement_start = offset + 1
+                paren_depth = 0
+
+        return roots
+
+    def _classify(self, header: str) -> Tuple[str, str]:
+        match = self._CONTRACT_HEADER.search(header)
+        if match:
+            return "contract", match.group(2)
+        match = self._FUNCTION_HEADER.search(header)
+        if match:
+            return "function", next(g for g in match.groups() if g)
+        if self._LOOP_HEADER.search(header):
+            return "loop", ""
+        if self._ASSEMBLY_HEADER.search(header):
+            return "assembly", ""
+        return "block", ""
+
+    def iter_blocks(self, kind: Optional[str] = None) -> Iterator[Block]:
+        """Yield blocks depth-first, optionally only those of one kind."""
+        pending = list(reversed(self.blocks))
+        while pending:
+            block = pending.pop()
+            if kind is None or block.kind == kind:
+                yield block
+            pending.extend(reversed(block.children))
+
+    def enclosing(self, offset: int, kind: str) -> Optional[Block]:
+        """Return the innermost block of a kind containing an offset."""
+        found = None
+        blocks, starts = self.blocks, self.block_starts
+        while blocks:
+            # Siblings are disjoint and ordered by start
+            index = bisect.bisect_right(starts, offset) - 1
+            if index < 0 or offset >= blocks[index].end:
+                break
+            inner = blocks[index]
+            if inner.kind == kind:
+                found = inner
+            blocks, starts = inner.children, inner.child_starts
+        return found
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number of an offset."""
+        return bisect.bisect_right(self.line_starts, offset)
+
+    def statement_start(self, offset: int) -> int:
+        """Return the offset where the statement containing an offset begins."""
+        return max(self.code.rfind(c, 0, offset) for c in ';{}') + 1
+
+    def statement_end(self, offset: int) -> int:
+        """Return the offset just past the statement containing an offset."""
+        end = self.code.find(';', offset)
+        return len(self.code) if end == -1 else end + 1
+
 
 
 class SecurityScanner:
+    # External value transfers and low-level calls
+    CALL = re.compile(r'\.(?:call|transfer|send)\s*[{(]')
+    LOW_LEVEL_CALL = re.compile(r'\.call\s*[{(]')
+    CHECKED_RESULT = re.compile(r'\(\s*bool\s+\w+\s*,|\brequire\s*\(')
+    STATE_CHANGE = re.compile(r'[\w\]]\s*(?:[+\-*/%|&^]|<<|>>)?=(?!=)|\+\+|--|\bdelete\s')
+    TX_ORIGIN_AUTH = re.compile(r'\b(?:require|if|assert)\b.*\btx\.origin\b')
+    FLOATING_PRAGMA = re.compile(r'\bpragma\s+solidity\s*\^')
+    DEPRECATED = [
+        (re.compile(r'\bblock\.blockhash\b'), 'block.blockhash', 'blockhash()'),
+        (re.compile(r'\bmsg\.gas\b'), 'msg.gas', 'gasleft()'),
+        (re.compile(r'\bthrow\b'), 'throw', 'revert()'),
+        (re.compile(r'\bsha3\b'), 'sha3', 'keccak256()'),
+        (re.compile(r'\bsuicide\b'), 'suicide', 'selfdestruct()'),
+    ]
+    ADDRESS_LITERAL = re.compile(r'0x[a-fA-F0-9]{40}')
+    ZERO_ADDRESS = re.compile(r'address\(0\)|address\(0x0\)')
+    ASSEMBLY = re.compile(r'\bassembly\s*(?:\([^)]*\)\s*)?\{')
+    SELFDESTRUCT = re.compile(r'\bselfdestruct\s*\(')
+    DELEGATECALL = re.compile(r'\.delegatecall\s*\(')
+    BLOCK_TIMESTAMP = re.compile(r'block\.timestamp\s*[<>=!]+')
+    REENTRANCY_GUARD = re.compile(r'ReentrancyGuard|nonReentrant')
+
     def __init__(self):
         self.findings: List[Finding] = []
 
     def scan_file(self, filepath: Path) -> List[Finding]:
         """Scan a single Solidity file for vulnerabilities."""
+        findings = self.scan_source(filepath.read_text(encoding="utf-8", errors="ignore"))
+        for finding in findings:
+            finding.file = str(filepath)
+        return findings
+
+    def scan_source(self, content: str) -> List[Finding]:
+        """Scan Solidity source text for vulnerabilities."""
         self.findings = []
-        content = filepath.read_text()
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines, 1):
-            self._check_reentrancy(line, i, lines)
-            self._check_tx_origin(line, i)
-            self._check_unchecked_call(line, i)
-            self._check_floating_pragma(line, i)
-            self._check_deprecated_functions(line, i)
-            self._check_hardcoded_addresses(line, i)
-            self._check_assembly(line, i)
-            self._check_selfdestruct(line, i)
-            self._check_delegatecall(line, i)
-            self._check_block_timestamp(line, i)
-
-        # Multi-line checks
-        self._check_missing_reentrancy_guard(content, lines)
-        self._check_external_calls_in_loop(content, lines)
+        source = SourceUnit(content)
+
+        for i, line in enumerate(source.code_lines, 1):
+            self._check_reentrancy(source, line, i)
+            self._check_tx_origin(source, line, i)
+            self._check_unchecked_call(source, line, i)
+            self._check_floating_pragma(source, line, i)
+            self._check_deprecated_functions(source, line, i)
+            self._check_hardcoded_addresses(source, line, i)
+            self._check_assembly(source, line, i)
+            self._check_selfdestruct(source, line, i)
+            self._check_delegatecall(source, line, i)
+            self._check_block_timestamp(source, line, i)
+
+        # Whole-contract checks
+        self._check_missing_reentrancy_guard(source)
+        self._check_external_calls_in_loop(source)
 
         return self.findings
 
-    def _check_reentrancy(self, line: str, line_num: int, lines: List[str]):
-        """Detect potential reentrancy vulnerabilities."""
-        # Pattern: external call followed by state change
-        call_patterns = [
-            r'\.call\{',
-            r'\.call\(',
-            r'\.transfer\(',
-            r'\.send\(',
-        ]
-
-        for pattern in call_patterns:
-            if re.search(pattern, line):
-                # Check if there are state changes after this line
-                for j in range(line_num, min(line_num + 10, len(lines))):
-                    subsequent_line = lines[j - 1] if j <= len(lines) else ""
-                    if re.search(r'\w+\s*[+\-*/]?=\s*', subsequent_line):
-                        self.findings.append(Finding(
-                            severity=Severity.CRITICAL,
-                            title="Potential Reentrancy",
-                            description="External call detected with potential state changes after. Follow Checks-Effects-Interactions pattern.",
-                            line=line_num,
-                            code=line.strip(),
-                            recommendation="Move state changes before external calls, or use ReentrancyGuard."
-                        ))
-                        break
-
-    def _check_tx_origin(self, line: str, line_num: int):
+    def _add(self, source: SourceUnit, line_num: int, severity: Severity,
+             title: str, description: str, recommendation: str):
+        self.findings.append(Finding(
+            severity=severity,
+            title=title,
+            description=description,
+            line=line_num,
+            code=source.lines[line_num - 1].strip() if line_num > 0 else "",
+            recommendation=recommendation,
+        ))
+
+    def _check_reentrancy(self, source: SourceUnit, line: str, line_num: int):
+        """Detect external calls followed by state changes in the same function."""
+        line_start = source.line_starts[line_num - 1]
+
+        for match in self.CALL.finditer(line):
+            offset = line_start + match.start()
+            function = source.enclosing(offset, "function")
+            scope_end = function.end if function else len(source.code)
+
+            # State changes after the statement making the call
+            after_call = source.code[source.statement_end(offset):scope_end]
+            if self.STATE_CHANGE.search(after_call):
+                self._add(
+                    source, line_num, Severity.CRITICAL,
+                    "Potential Reentrancy",
+                    "External call detected with potential state changes after. Follow Checks-Effects-Interactions pattern.",
+                    "Move state changes before external calls, or use ReentrancyGuard.",
+                )
+                break
+
+    def _check_tx_origin(self, source: SourceUnit, line: str, line_num: int):
         """Detect tx.origin usage for authentication."""
-        if re.search(r'tx\.origin', line):
-            if re.search(r'(require|if|assert).*tx\.origin', line):
-                self.findings.append(Finding(
-                    severity=Severity.HIGH,
-                    title="tx.origin Authentication",
-                    description="tx.origin used for authentication is vulnerable to phishing attacks.",
-                    line=line_num,
-                    code=line.strip(),
-                    recommendation="Use msg.sender instead of tx.origin for authentication."
-                ))
-
-    def _check_unchecked_call(self, line: str, line_num: int):
+        if self.TX_ORIGIN_AUTH.search(line):
+            self._add(
+                source, line_num, Severity.HIGH,
+                "tx.origin Authentication",
+                "tx.origin used for authentication is vulnerable to phishing attacks.",
+                "Use msg.sender instead of tx.origin for authentication.",
+            )
+
+    def _check_unchecked_call(self, source: SourceUnit, line: str, line_num: int):
         """Detect unchecked low-level call return values."""
-        if re.search(r'\.call\(', line) or re.search(r'\.call\{', line):
-            if not re.search(r'\(bool\s+\w+,', line) and not re.search(r'require\(', line):
-                self.findings.append(Finding(
-                    severity=Severity.HIGH,
-                    title="Unchecked Call Return Value",
-                    description="Low-level call return value not checked.",
-                    line=line_num,
-                    code=line.strip(),
-                    recommendation="Check the return value: (bool success,) = addr.call{...}(...); require(success);"
-                ))
-
-    def _check_floating_pragma(self, line: str, line_num: int):
+        match = self.LOW_LEVEL_CALL.search(line)
+        if not match:
+            return
+
+        # The result may be captured on an earlier line of the same statement
+        offset = source.line_starts[line_num - 1] + match.start()
+        statement = source.code[source.statement_start(offset):source.statement_end(offset)]
+        if not self.CHECKED_RESULT.search(statement):
+            self._add(
+                source, line_num, Severity.HIGH,
+                "Unchecked Call Return Value",
+                "Low-level call return value not checked.",
+                "Check the return value: (bool success,) = addr.call{...}(...); require(success);",
+            )
+
+    def _check_floating_pragma(self, source: SourceUnit, line: str, line_num: int):
         """Detect floating pragma versions."""
-        if re.search(r'pragma\s+solidity\s*\^', line):
-            self.findings.append(Finding(
-                severity=Severity.LOW,
-                title="Floating Pragma",
-                description="Floating pragma version allows compilation with different compiler versions.",
-                line=line_num,
-                code=line.strip(),
-                recommendation="Use fixed pragma version: pragma solidity 0.8.20;"
-            ))
-
-    def _check_deprecated_functions(self, line: str, line_num: int):
+        if self.FLOATING_PRAGMA.search(line):
+            self._add(
+                source, line_num, Severity.LOW,
+                "Floating Pragma",
+                "Floating pragma version allows compilation with different compiler versions.",
+                "Use fixed pragma version: pragma solidity 0.8.20;",
+            )
+
+    def _check_deprecated_functions(self, source: SourceUnit, line: str, line_num: int):
         """Detect deprecated function usage."""
-        deprecated = {
-            'block.blockhash': 'blockhash()',
-            'msg.gas': 'gasleft()',
-            'throw': 'revert()',
-            'sha3': 'keccak256()',
-            'suicide': 'selfdestruct()',
-        }
-
-        for old, new in deprecated.items():
-            if old in line:
-                self.findings.append(Finding(
-                    severity=Severity.INFO,
-                    title="Deprecated Function",
-                    description=f"'{old}' is deprecated.",
-                    line=line_num,
-                    code=line.strip(),
-                    recommendation=f"Use '{new}' instead."
-                ))
-
-    def _check_hardcoded_addresses(self, line: str, line_num: int):
+        for pattern, old, new in self.DEPRECATED:
+            if pattern.search(line):
+                self._add(
+                    source, line_num, Severity.INFO,
+                    "Deprecated Function",
+                    f"'{old}' is deprecated.",
+                    f"Use '{new}' instead.",
+                )
+
+    def _check_hardcoded_addresses(self, source: SourceUnit, line: str, line_num: int):
         """Detect hardcoded addresses."""
-        if re.search(r'0x[a-fA-F0-9]{40}', line):
-            if not re.search(r'address\(0\)|address\(0x0\)', line):
-                self.findings.append(Finding(
-                    severity=Severity.INFO,
-                    title="Hardcoded Address",
-                    description="Hardcoded address detected. Consider using immutable variables or constructor parameters.",
-                    line=line_num,
-                    code=line.strip(),
-                    recommendation="Use constructor parameters or immutable variables for addresses."
-                ))
-
-    def _check_assembly(self, line: str, line_num: int):
+        if self.ADDRESS_LITERAL.search(line) and not self.ZERO_ADDRESS.search(line):
+            self._add(
+                source, line_num, Severity.INFO,
+                "Hardcoded Address",
+                "Hardcoded address detected. Consider using immutable variables or constructor parameters.",
+                "Use constructor parameters or immutable variables for addresses.",
+            )
+
+    def _check_assembly(self, source: SourceUnit, line: str, line_num: int):
         """Flag assembly usage for manual review."""
-        if re.search(r'\bassembly\s*\{', line):
-            self.findings.append(Finding(
-                severity=Severity.INFO,
-                title="Inline Assembly",
-                description="Inline assembly detected. Requires careful manual review.",
-                line=line_num,
-                code=line.strip(),
-                recommendation="Ensure assembly code is thoroughly reviewed and tested."
-            ))
-
-    def _check_selfdestruct(self, line: str, line_num: int):
+        if self.ASSEMBLY.search(line):
+            self._add(
+                source, line_num, Severity.INFO,
+                "Inline Assembly",
+                "Inline assembly detected. Requires careful manual review.",
+                "Ensure assembly code is thoroughly reviewed and tested.",
+            )
+
+    def _check_selfdestruct(self, source: SourceUnit, line: str, line_num: int):
         """Detect selfdestruct usage."""
-        if re.search(r'\bselfdestruct\s*\(', line):
-            self.findings.append(Finding(
-                severity=Severity.MEDIUM,
-                title="Selfdestruct Usage",
-                description="selfdestruct can permanently destroy the contract and forcibly send ETH.",
-                line=line_num,
-                code=line.strip(),
-                recommendation="Ensure selfdestruct is properly access-controlled and intended."
-            ))
-
-    def _check_delegatecall(self, line: str, line_num: int):
+        if self.SELFDESTRUCT.search(line):
+            self._add(
+                source, line_num, Severity.MEDIUM,
+                "Selfdestruct Usage",
+                "selfdestruct can permanently destroy the contract and forcibly send ETH.",
+                "Ensure selfdestruct is properly access-controlled and intended.",
+            )
+
+    def _check_delegatecall(self, source: SourceUnit, line: str, line_num: int):
         """Detect delegatecall usage."""
-        if re.search(r'\.delegatecall\(', line):
-            self.findings.append(Finding(
-                severity=Severity.HIGH,
-                title="Delegatecall Usage",
-                description="delegatecall executes code in calling contract's context. High risk of storage collision or malicious code execution.",
-                line=line_num,
-                code=line.strip(),
-                recommendation="Ensure delegatecall target is trusted and storage layout is compatible."
-            ))
-
-    def _check_block_timestamp(self, line: str, line_num: int):
+        if self.DELEGATECALL.search(line):
+            self._add(
+                source, line_num, Severity.HIGH,
+                "Delegatecall Usage",
+                "delegatecall executes code in calling contract's context. High risk of storage collision or malicious code execution.",
+                "Ensure delegatecall target is trusted and storage layout is compatible.",
+            )
+
+    def _check_block_timestamp(self, source: SourceUnit, line: str, line_num: int):
         """Detect block.timestamp usage in comparisons."""
-        if re.search(r'block\.timestamp\s*[<>=!]+', line):
-            self.findings.append(Finding(
-                severity=Severity.LOW,
-                title="Timestamp Dependence",
-                description="block.timestamp can be manipulated by miners within ~15 seconds.",
-                line=line_num,
-                code=line.strip(),
-                recommendation="Avoid using block.timestamp for critical logic. Consider block.number for longer timeframes."
-            ))
-
-    def _check_missing_reentrancy_guard(self, content: str, lines: List[str]):
+        if self.BLOCK_TIMESTAMP.search(line):
+            self._add(
+                source, line_num, Severity.LOW,
+                "Timestamp Dependence",
+                "block.timestamp can be manipulated by miners within ~15 seconds.",
+                "Avoid using block.timestamp for critical logic. Consider block.number for longer timeframes.",
+            )
+
+    def _check_missing_reentrancy_guard(self, source: SourceUnit):
         """Check if contract has external calls but no reentrancy guard."""
-        has_external_call = bool(re.search(r'\.call\{|\.call\(|\.transfer\(|\.send\(', content))
-        has_guard = bool(re.search(r'ReentrancyGuard|nonReentrant', content))
+        has_external_call = bool(self.CALL.search(source.code))
+        has_guard = bool(self.REENTRANCY_GUARD.search(source.code))
 
         if has_external_call and not has_guard:
-            self.findings.append(Finding(
-                severity=Severity.MEDIUM,
-                title="Missing Reentrancy Guard",
-                description="Contract has external calls but no ReentrancyGuard.",
-                line=0,
-                code="",
-                recommendation="Consider using OpenZeppelin's ReentrancyGuard for functions with external calls."
-            ))
-
-    def _check_external_calls_in_loop(self, content: str, lines: List[str]):
+            self._add(
+                source, 0, Severity.MEDIUM,
+                "Missing Reentrancy Guard",
+                "Contract has external calls but no ReentrancyGuard.",
+                "Consider using OpenZeppelin's ReentrancyGuard for functions with external calls.",
+            )
+
+    def _check_external_calls_in_loop(self, source: SourceUnit):
         """Detect external calls inside loops (DoS risk)."""
-        in_loop = False
-        loop_start = 0
-
-        for i, line in enumerate(lines, 1):
-            if re.search(r'\b(for|while)\s*\(', line):
-                in_loop = True
-                loop_start = i
-
-            if in_loop:
-                if re.search(r'\.call\{|\.call\(|\.transfer\(|\.send\(', line):
-                    self.findings.append(Finding(
-                        severity=Severity.MEDIUM,
-                        title="External Call in Loop",
-                        description="External call inside loop can cause DoS if any call fails.",
-                        line=i,
-                        code=line.strip(),
-                        recommendation="Use pull pattern instead of push pattern for payments."
-                    ))
-
-            if in_loop and '}' in line:
-                in_loop = False
-
-    def generate_report(self, filepath: Path) -> str:
-        """Generate a markdown report of findings."""
+        reported: Set[int] = set()
+
+        for loop in source.iter_blocks("loop"):
+            for match in self.CALL.finditer(source.code, loop.start, loop.end):
+                line_num = source.line_of(match.start())
+                if line_num in reported:
+                    continue
+                reported.add(line_num)
+                self._add(
+                    source, line_num, Severity.MEDIUM,
+                    "External Call in Loop",
+                    "External call inside loop can cause DoS if any call fails.",
+                    "Use pull pattern instead of push pattern for payments.",
+                )
+
+    def generate_report(self, filepath: Path, findings: Optional[List[Finding]] = None) -> str:
+        """Generate a markdown report of findings (defaults to the last scan)."""
+        if findings is None:
+            findings = self.findings
+
         report = [
             f"# Security Scan Report",
             f"\n**File**: `{filepath}`",
-            f"\n**Findings**: {len(self.findings)}",
+            f"\n**Findings**: {len(findings)}",
             "",
         ]
 
         # Count by severity
         severity_counts = {}
-        for finding in self.findings:
+        for finding in findings:
             severity_counts[finding.severity] = severity_counts.get(finding.severity, 0) + 1
 
         report.append("## Summary")
@@ -276,7 +471,7 @@ class SecurityScanner:
         report.append("## Findings")
         report.append("")
 
-        for i, finding in enumerate(self.findings, 1):
+        for i, finding in enumerate(findings, 1):
             report.append(f"### [{finding.severity.value}] {finding.title}")
             report.append("")
             if finding.line > 0:
@@ -293,30 +488,280 @@ class SecurityScanner:
         return "\n".join(report)
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python security_scan.py <contract.sol|directory>")
-        sys.exit(1)
+# Per-process scanner used by pool workers
+_worker_scanner: Optional[SecurityScanner] = None
 
-    target = Path(sys.argv[1])
-    scanner = SecurityScanner()
+
+def _scan_worker(filepath: Path) -> List[Finding]:
+    global _worker_scanner
+    if _worker_scanner is None:
+        _worker_scanner = SecurityScanner()
+    return _scan_one(_worker_scanner, filepath)
+
+
+def _scan_one(scanner: SecurityScanner, filepath: Path) -> List[Finding]:
+    try:
+        return scanner.scan_file(filepath)
+    except OSError as e:
+        print(f"Error reading {filepath}: {e}", file=sys.stderr)
+        return []
+
+
+def scan_files(files: List[Path], jobs: int = 1) -> Iterator[Tuple[Path, List[Finding]]]:
+    """Scan files, in a process pool if jobs > 1, yielding results in file order.
+
+    Byte-identical files (e.g. vendored OpenZeppelin copies) are scanned once
+    and their findings repeated for every copy. Only files whose size is
+    shared with another file can be copies, so only those are hashed.
+    """
+    sizes: List[Optional[int]] = []
+    for filepath in files:
+        try:
+            sizes.append(filepath.stat().st_size)
+        except OSError:
+            sizes.append(None)
+    counts = Counter(sizes)
+
+    copies: Dict[str, List[Path]] = {}
+    for filepath, size in zip(files, sizes):
+        key = f"path:{filepath}"
+        if size is not None and counts[size] > 1:
+            try:
+                key = hashlib.sha256(filepath.read_bytes()).hexdigest()
+            except OSError:
+                pass
+        copies.setdefault(key, []).append(filepath)
+    unique_files = [paths[0] for paths in copies.values()]
+
+    if jobs <= 1 or len(unique_files) <= 1:
+        scanner = SecurityScanner()
+        per_file = [_scan_one(scanner, filepath) for filepath in unique_files]
+    else:
+        chunksize = max(1, len(unique_files) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            per_file = list(pool.map(_scan_worker, unique_files, chunksize=chunksize))
+
+    by_file: Dict[Path, List[Finding]] = {}
+    for paths, findings in zip(copies.values(), per_file):
+        for filepath in paths:
+            by_file[filepath] = [replace(f, file=str(filepath)) for f in findings]
+
+    for filepath in files:
+        yield filepath, by_file[filepath]
+
+
+# ============================================================================
+# Aggregate Reports
+# ============================================================================
+
+def aggregate(findings: List[Finding]) -> List[dict]:
+    """Group identical findings (same issue and code) across files and lines.
+
+    Vendored copies of the same library produce the same finding many times;
+    each group is reported once with all of its locations.
+    """
+    groups: Dict[tuple, dict] = {}
+    seen: Set[tuple] = set()
+
+    for f in findings:
+        key = (f.severity, f.title, f.description, f.code, f.recommendation)
+        group = groups.setdefault(key, {"finding": f, "locations": []})
+        location = (f.file or "", f.line)
+        if (key, location) not in seen:
+            seen.add((key, location))
+            group["locations"].append(location)
+
+    severity_order = list(Severity)
+    return sorted(
+        groups.values(),
+        key=lambda g: severity_order.index(g["finding"].severity),
+    )
+
+
+def report_text(groups: List[dict], files_scanned: int) -> str:
+    """Generate an aggregate text report."""
+    if not groups:
+        return f"✅ No security issues found in {files_scanned} file(s)!"
+
+    lines = [
+        "=" * 70,
+        "SMART CONTRACT SECURITY SCAN",
+        "=" * 70,
+        "",
+        f"Files scanned: {files_scanned}",
+        "",
+        "SUMMARY:",
+    ]
+
+    counts: Dict[Severity, int] = {}
+    for group in groups:
+        severity = group["finding"].severity
+        counts[severity] = counts.get(severity, 0) + len(group["locations"])
+    for sev in Severity:
+        if sev in counts:
+            lines.append(f"  {sev.value}: {counts[sev]}")
+
+    for group in groups:
+        f = group["finding"]
+        locations = group["locations"]
+        lines.append("")
+        lines.append("-" * 70)
+        lines.append(f"[{f.severity.value}] {f.title} ({len(locations)} location(s))")
+        lines.append(f"   {f.description}")
+        if f.code:
+            lines.append(f"   Code: {f.code}")
+        for file, line in locations[:20]:
+            lines.append(f"   - {file}:{line}" if line > 0 else f"   - {file}")
+        if len(locations) > 20:
+            lines.append(f"   ... and {len(locations) - 20} more")
+        lines.append(f"   Fix: {f.recommendation}")
+
+    lines.append("")
+    lines.append("=" * 70)
+    lines.append(f"Total: {sum(counts.values())} issue(s), {len(groups)} unique")
+    lines.append("=" * 70)
+
+    return "\n".join(lines)
+
+
+def report_json(groups: List[dict], files_scanned: int) -> str:
+    """Generate an aggregate JSON report."""
+    return json.dumps(
+        {
+            "files_scanned": files_scanned,
+            "total": sum(len(g["locations"]) for g in groups),
+            "unique": len(groups),
+            "findings": [
+                {
+                    "severity": g["finding"].severity.value,
+                    "title": g["finding"].title,
+                    "description": g["finding"].description,
+                    "code": g["finding"].code,
+                    "recommendation": g["finding"].recommendation,
+                    "locations": [
+                        {"file": file, "line": line}
+                        for file, line in g["locations"]
+                    ],
+                }
+                for g in groups
+            ],
+        },
+        indent=2,
+    )
+
+
+def report_sarif(groups: List[dict], files_scanned: int) -> str:
+    """Generate a SARIF report for GitHub integration."""
+    rules = {}
+    results = []
+    levels = {
+        Severity.CRITICAL: "error",
+        Severity.HIGH: "error",
+        Severity.MEDIUM: "warning",
+        Severity.LOW: "note",
+        Severity.INFO: "note",
+    }
+
+    for g in groups:
+        f = g["finding"]
+        rule_id = f.title.replace(" ", "_").replace(".", "_")
+
+        if rule_id not in rules:
+            rules[rule_id] = {
+                "id": rule_id,
+                "name": f.title,
+                "shortDescription": {"text": f.title},
+                "fullDescription": {"text": f.description},
+                "help": {"text": f.recommendation},
+                "defaultConfiguration": {"level": levels[f.severity]},
+            }
+
+        for file, line in g["locations"]:
+            location = {"artifactLocation": {"uri": file}}
+            if line > 0:
+                location["region"] = {"startLine": line}
+            results.append({
+                "ruleId": rule_id,
+                "level": levels[f.severity],
+                "message": {"text": f"{f.description} {f.recommendation}"},
+                "locations": [{"physicalLocation": location}],
+            })
+
+    sarif = {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": "solidity-security-scan",
+                    "version": "1.0.0",
+                    "rules": list(rules.values()),
+                }
+            },
+            "results": results,
+        }],
+    }
+
+    return json.dumps(sarif, indent=2)
+
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Scan Solidity contracts for common vulnerability patterns"
+    )
+    parser.add_argument(
+        "target",
+        type=Path,
+        help="Contract file or directory to scan",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["markdown", "text", "json", "sarif"],
+        default="markdown",
+        help="markdown prints a report per file; text/json/sarif print one "
+             "deduplicated report for all files (default: markdown)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes, 0 = all CPUs (default: 1)",
+    )
+    parser.add_argument(
+        "--exit-code",
+        action="store_true",
+        help="Exit with non-zero code if issues found",
+    )
+
+    args = parser.parse_args()
+    target = args.target
 
     if target.is_file():
         files = [target]
     elif target.is_dir():
-        files = list(target.rglob("*.sol"))
+        files = sorted(target.rglob("*.sol"))
     else:
-        print(f"Error: {target} not found")
+        print(f"Error: {target} not found", file=sys.stderr)
         sys.exit(1)
 
-    for filepath in files:
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    all_findings: List[Finding] = []
+    scanner = SecurityScanner()
+
+    for filepath, findings in scan_files(files, jobs):
+        all_findings.extend(findings)
+        if args.format != "markdown":
+            continue
+
         print(f"\n{'='*60}")
         print(f"Scanning: {filepath}")
         print('='*60)
 
-        findings = scanner.scan_file(filepath)
-        report = scanner.generate_report(filepath)
-        print(report)
+        print(scanner.generate_report(filepath, findings))
 
         # Summary
         critical = sum(1 for f in findings if f.severity == Severity.CRITICAL)
@@ -327,6 +772,23 @@ def main():
         if high > 0:
             print(f"\n⚠️  {high} HIGH severity issues found!")
 
+    if args.format != "markdown":
+        groups = aggregate(all_findings)
+        if args.format == "json":
+            print(report_json(groups, len(files)))
+        elif args.format == "sarif":
+            print(report_sarif(groups, len(files)))
+        else:
+            print(report_text(groups, len(files)))
+
+    if args.exit_code and all_findings:
+        # Exit with number of critical/high issues (max 125)
+        critical_high = sum(
+            1 for f in all_findings
+            if f.severity in [Severity.CRITICAL, Severity.HIGH]
+        )
+        sys.exit(min(critical_high, 125) or 1)
+
 
 if __name__ == "__main__":
     main()